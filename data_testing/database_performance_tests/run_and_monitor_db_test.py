@@ -4,27 +4,45 @@ Supports: PostgreSQL database with PetClinic schema (owners, pets, vets, visits,
 """
 
 import argparse
+import io
 import json
 import os
 import signal
+import struct
 import subprocess
 import sys
+import threading
 import time
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
 from random import choice, randint, random, sample
 
+import numpy as np
 import psycopg2
+import psycopg2.errors
 from psycopg2 import sql
+from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
 
 # Optional imports for graphing
 try:
+    import matplotlib
+    matplotlib.use('Agg')  # Render straight to file; no GUI backend needed
     import matplotlib.pyplot as plt
     import pandas as pd
     GRAPHING_AVAILABLE = True
 except ImportError:
     GRAPHING_AVAILABLE = False
 
+# Optional import for cross-platform system monitoring
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 # Configuration
 CURRENT_DIR = Path(__file__).parent
 JMETER_TEST_PLAN = CURRENT_DIR / "JMeter_DB_Mixed_Operations.jmx"
@@ -85,12 +103,12 @@ def get_connection_from_config(environment, config_file):
     """Get PostgreSQL connection from config file"""
     config = load_config(config_file)
     if not config:
-        return None, None
+        return None, None, None
     
     if environment not in config['environments']:
         print_color(f"Error: Environment '{environment}' not found in config", Colors.RED)
         print(f"Available environments: {', '.join(config['environments'].keys())}")
-        return None, None
+        return None, None, None
     
     env_config = config['environments'][environment]
     db_name = env_config['database']
@@ -108,7 +126,7 @@ def get_connection_from_config(environment, config_file):
     print(f"    Database: {host}:{conn_params['port']}/{db_name}")
     print(f"    User: {env_config['username']}")
     
-    return conn_params, db_name
+    return conn_params, db_name, env_config
 
 def get_connection(conn_params):
     """Create PostgreSQL database connection"""
@@ -140,15 +158,28 @@ def cleanup_database(conn_params):
             'types'
         ]
         
-        total_deleted = 0
-        for table in tables_order:
-            cursor.execute(f"DELETE FROM {table}")
-            deleted = cursor.rowcount
-            total_deleted += deleted
-            print(f"  Cleaned {table}: {deleted} records")
+        try:
+            # TRUNCATE resets the tables in one statement without per-row WAL or dead tuples
+            cursor.execute(sql.SQL("TRUNCATE TABLE {} RESTART IDENTITY CASCADE").format(
+                sql.SQL(', ').join(map(sql.Identifier, tables_order))))
+            print(f"  Truncated {len(tables_order)} tables: {', '.join(tables_order)}")
+            cleanup_summary = "all tables truncated"
+        except psycopg2.errors.InsufficientPrivilege:
+            # Role cannot TRUNCATE; fall back to per-table DELETE
+            conn.rollback()
+            print_color("  TRUNCATE not permitted, falling back to DELETE", Colors.YELLOW)
+            total_deleted = 0
+            for table in tables_order:
+                cursor.execute(f"DELETE FROM {table}")
+                deleted = cursor.rowcount
+                total_deleted += deleted
+                print(f"  Cleaned {table}: {deleted} records")
+            cleanup_summary = f"{total_deleted} total records removed"
         
         conn.commit()
-        print_color(f"\n  ✓ Cleanup complete: {total_deleted} total records removed", Colors.GREEN)
+        # Cached parent IDs no longer exist
+        _ID_CACHE.clear()
+        print_color(f"\n  ✓ Cleanup complete: {cleanup_summary}", Colors.GREEN)
         return True
         
     except psycopg2.Error as e:
@@ -193,22 +224,177 @@ PET_NAMES = [
     'Rocky', 'Molly', 'Duke', 'Maggie', 'Bear', 'Sophie', 'Zeus', 'Sadie'
 ]
 
-def seed_types(conn_params, count=6):
+VISIT_DESCRIPTIONS = [
+    'Annual checkup', 'Vaccination', 'Dental cleaning', 'Surgery consultation',
+    'Skin condition', 'Weight check', 'Behavior consultation', 'Emergency visit',
+    'Follow-up examination', 'Routine care'
+]
+
+# Vectorized random generator used for the bulk seeders
+RNG = np.random.default_rng()
+
+# Street suffixes pre-joined with their separator so an address is one concatenation
+ADDRESS_SUFFIXES = np.array([f' {street}' for street in STREET_NAMES])
+
+# Ready-made (first_name, last_name, address, city, telephone) tuples, built on first use
+OWNER_POOL_SIZE = 10000
+_OWNER_POOL = []
+
+def owner_pool():
+    """Return the owner tuple pool, generating it once per process"""
+    if not _OWNER_POOL:
+        size = OWNER_POOL_SIZE
+        addresses = np.char.add(
+            RNG.integers(100, 10000, size=size).astype(str),
+            RNG.choice(ADDRESS_SUFFIXES, size=size)
+        )
+        phones = (RNG.integers(100, 1000, size=size) * 10**7
+                  + RNG.integers(100, 1000, size=size) * 10**4
+                  + RNG.integers(1000, 10000, size=size))
+        _OWNER_POOL.extend(zip(
+            RNG.choice(FIRST_NAMES, size=size).tolist(),
+            RNG.choice(LAST_NAMES, size=size).tolist(),
+            addresses.tolist(),
+            RNG.choice(CITIES, size=size).tolist(),
+            phones.tolist()
+        ))
+    return _OWNER_POOL
+
+def random_dates(first_year, last_year, count):
+    """Draw random dates (day 1-28 so every month is valid)"""
+    years = RNG.integers(first_year - 1970, last_year - 1970 + 1, size=count).astype('datetime64[Y]')
+    months = RNG.integers(0, 12, size=count).astype('timedelta64[M]')
+    days = RNG.integers(0, 28, size=count).astype('timedelta64[D]')
+    return (years + months).astype('datetime64[D]') + days
+
+# Server-side generators: rows are built entirely in PostgreSQL with generate_series
+OWNERS_SERIES_SQL = """
+    WITH pools AS (
+        SELECT %(first_names)s::text[] AS first_names, %(last_names)s::text[] AS last_names,
+               %(streets)s::text[] AS streets, %(cities)s::text[] AS cities
+    )
+    INSERT INTO owners (first_name, last_name, address, city, telephone)
+    SELECT first_names[1 + floor(random() * cardinality(first_names))::int],
+           last_names[1 + floor(random() * cardinality(last_names))::int],
+           (100 + floor(random() * 9900))::int || ' ' || streets[1 + floor(random() * cardinality(streets))::int],
+           cities[1 + floor(random() * cardinality(cities))::int],
+           (100 + floor(random() * 900))::int::text
+               || (100 + floor(random() * 900))::int::text
+               || (1000 + floor(random() * 9000))::int::text
+    FROM pools, generate_series(1, %(count)s)
+"""
+
+PETS_SERIES_SQL = """
+    WITH pools AS (
+        SELECT %(pet_names)s::text[] AS pet_names,
+               (SELECT array_agg(id) FROM types) AS type_ids,
+               (SELECT array_agg(id) FROM owners) AS owner_ids
+    )
+    INSERT INTO pets (name, birth_date, type_id, owner_id)
+    SELECT pet_names[1 + floor(random() * cardinality(pet_names))::int],
+           make_date(2010 + floor(random() * 14)::int, 1 + floor(random() * 12)::int, 1 + floor(random() * 28)::int),
+           type_ids[1 + floor(random() * cardinality(type_ids))::int],
+           owner_ids[1 + floor(random() * cardinality(owner_ids))::int]
+    FROM pools, generate_series(1, %(count)s)
+    WHERE type_ids IS NOT NULL AND owner_ids IS NOT NULL
+"""
+
+VISITS_SERIES_SQL = """
+    WITH pools AS (
+        SELECT %(descriptions)s::text[] AS descriptions,
+               (SELECT array_agg(id) FROM pets) AS pet_ids
+    )
+    INSERT INTO visits (pet_id, visit_date, description)
+    SELECT pet_ids[1 + floor(random() * cardinality(pet_ids))::int],
+           make_date(2020 + floor(random() * 5)::int, 1 + floor(random() * 12)::int, 1 + floor(random() * 28)::int),
+           descriptions[1 + floor(random() * cardinality(descriptions))::int]
+    FROM pools, generate_series(1, %(count)s)
+    WHERE pet_ids IS NOT NULL
+"""
+
+# Tables populated by seed_all_tables
+SEED_TABLES = ('types', 'specialties', 'owners', 'pets', 'vets', 'vet_specialties', 'visits')
+
+def drop_secondary_indexes(cursor, tables):
+    """Drop indexes not backing a constraint and return their definitions"""
+    cursor.execute("""
+        SELECT n.nspname, c.relname, pg_get_indexdef(i.indexrelid)
+        FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE i.indrelid IN (SELECT to_regclass(t) FROM unnest(%s::text[]) AS t)
+          AND NOT EXISTS (SELECT 1 FROM pg_constraint con WHERE con.conindid = i.indexrelid)
+    """, (list(tables),))
+    indexes = cursor.fetchall()
+    
+    for schema, index_name, _ in indexes:
+        cursor.execute(sql.SQL("DROP INDEX {}.{}").format(sql.Identifier(schema), sql.Identifier(index_name)))
+    return [index_def for _, _, index_def in indexes]
+
+# Parent-table IDs known to this process, keyed by table name. Filled once at
+# the start of seed_all_tables and extended by each seeder as it inserts rows.
+_ID_CACHE = {}
+PARENT_TABLES = ('types', 'specialties', 'owners', 'vets', 'pets')
+
+def load_id_cache(cursor, tables=PARENT_TABLES):
+    """Fetch the existing IDs of all parent tables in a single round-trip"""
+    query = sql.SQL(' UNION ALL ').join(
+        sql.SQL("SELECT {}, id FROM {}").format(sql.Literal(table), sql.Identifier(table))
+        for table in tables
+    )
+    cursor.execute(query)
+    
+    _ID_CACHE.clear()
+    for table in tables:
+        _ID_CACHE[table] = []
+    for table, row_id in cursor.fetchall():
+        _ID_CACHE[table].append(row_id)
+
+def cached_ids(cursor, table):
+    """Return the IDs of a table, querying only when they are not cached"""
+    if table not in _ID_CACHE:
+        cursor.execute(sql.SQL("SELECT id FROM {}").format(sql.Identifier(table)))
+        _ID_CACHE[table] = [row[0] for row in cursor.fetchall()]
+    return _ID_CACHE[table]
+
+def remember_ids(table, ids):
+    """Add freshly inserted IDs to an already loaded cache entry"""
+    if table in _ID_CACHE:
+        _ID_CACHE[table].extend(ids)
+
+def reserve_ids(cursor, table, count):
+    """Draw IDs from the table's sequence so COPY rows have known keys"""
+    cursor.execute(
+        "SELECT nextval(pg_get_serial_sequence(%s, 'id')) FROM generate_series(1, %s)",
+        (table, count)
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+# The lookup-table seeders (types, specialties, vets, vet_specialties) each send a
+# single multi-row INSERT via execute_values, so every table costs one parse and one
+# round trip; a PREPARE'd statement would only pay off if the INSERT ran repeatedly.
+def seed_types(conn_params, count=6, conn=None):
     """Seed pet types"""
-    conn = get_connection(conn_params)
-    if not conn:
-        return False
+    owns_conn = conn is None
+    if owns_conn:
+        conn = get_connection(conn_params)
+        if not conn:
+            return False
     
     try:
         cursor = conn.cursor()
         
-        for pet_type in PET_TYPES[:count]:
-            cursor.execute(
-                "INSERT INTO types (name) VALUES (%s) ON CONFLICT DO NOTHING",
-                (pet_type,)
-            )
+        ids = execute_values(
+            cursor,
+            "INSERT INTO types (name) VALUES %s ON CONFLICT DO NOTHING RETURNING id",
+            [(pet_type,) for pet_type in PET_TYPES[:count]],
+            fetch=True
+        )
+        remember_ids('types', [row[0] for row in ids])
         
-        conn.commit()
+        # A caller-supplied connection is committed by the caller
+        if owns_conn:
+            conn.commit()
         print_color(f"  ✓ Seeded {count} pet types", Colors.GREEN)
         return True
         
@@ -218,24 +404,31 @@ def seed_types(conn_params, count=6):
         return False
     finally:
         cursor.close()
-        conn.close()
+        if owns_conn:
+            conn.close()
 
-def seed_specialties(conn_params, count=6):
+def seed_specialties(conn_params, count=6, conn=None):
     """Seed vet specialties"""
-    conn = get_connection(conn_params)
-    if not conn:
-        return False
+    owns_conn = conn is None
+    if owns_conn:
+        conn = get_connection(conn_params)
+        if not conn:
+            return False
     
     try:
         cursor = conn.cursor()
         
-        for specialty in SPECIALTIES[:count]:
-            cursor.execute(
-                "INSERT INTO specialties (name) VALUES (%s) ON CONFLICT DO NOTHING",
-                (specialty,)
-            )
+        ids = execute_values(
+            cursor,
+            "INSERT INTO specialties (name) VALUES %s ON CONFLICT DO NOTHING RETURNING id",
+            [(specialty,) for specialty in SPECIALTIES[:count]],
+            fetch=True
+        )
+        remember_ids('specialties', [row[0] for row in ids])
         
-        conn.commit()
+        # A caller-supplied connection is committed by the caller
+        if owns_conn:
+            conn.commit()
         print_color(f"  ✓ Seeded {count} specialties", Colors.GREEN)
         return True
         
@@ -245,41 +438,103 @@ def seed_specialties(conn_params, count=6):
         return False
     finally:
         cursor.close()
-        conn.close()
+        if owns_conn:
+            conn.close()
+
+# COPY text-format escapes, applied in a single pass per value
+COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
 
-def seed_owners(conn_params, count=1000):
+def _copy_text(value):
+    """Escape a value for the PostgreSQL COPY text format"""
+    # IDs and phone numbers are ints and need no escaping
+    if isinstance(value, str):
+        return value.translate(COPY_ESCAPES)
+    return str(value)
+
+def copy_rows(cursor, table, columns, rows):
+    """Bulk load rows into a table with COPY FROM STDIN (text format)"""
+    buf = io.StringIO()
+    buf.writelines('\t'.join(map(_copy_text, row)) + '\n' for row in rows)
+    buf.seek(0)
+    
+    copy_sql = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT text)").format(
+        sql.Identifier(table),
+        sql.SQL(', ').join(map(sql.Identifier, columns))
+    )
+    cursor.copy_expert(copy_sql, buf)
+
+# PGCOPY binary framing: signature, flags and header-extension length, then a -1 trailer
+PGCOPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+PGCOPY_TRAILER = struct.pack('>h', -1)
+PG_EPOCH_ORDINAL = date(2000, 1, 1).toordinal()
+INT4_FIELD = struct.Struct('>ii')
+FIELD_LENGTH = struct.Struct('>i')
+
+def _binary_field(value):
+    """Encode a value as a length-prefixed PGCOPY field (int4, date or text)"""
+    if isinstance(value, int):
+        return INT4_FIELD.pack(4, value)
+    if isinstance(value, date):
+        return INT4_FIELD.pack(4, value.toordinal() - PG_EPOCH_ORDINAL)
+    data = value.encode('utf-8')
+    return FIELD_LENGTH.pack(len(data)) + data
+
+def copy_rows_binary(cursor, table, columns, rows):
+    """Bulk load rows with binary COPY, falling back to text COPY if the server rejects it"""
+    rows = list(rows)
+    field_count = struct.pack('>h', len(columns))
+    
+    buf = io.BytesIO()
+    buf.write(PGCOPY_HEADER)
+    buf.writelines(field_count + b''.join(map(_binary_field, row)) for row in rows)
+    buf.write(PGCOPY_TRAILER)
+    buf.seek(0)
+    
+    copy_sql = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT binary)").format(
+        sql.Identifier(table),
+        sql.SQL(', ').join(map(sql.Identifier, columns))
+    )
+    
+    # Binary values must match the column types exactly (e.g. int4, not int8)
+    cursor.execute("SAVEPOINT binary_copy")
+    try:
+        cursor.copy_expert(copy_sql, buf)
+    except (psycopg2.DataError, psycopg2.errors.ProtocolViolation) as e:
+        cursor.execute("ROLLBACK TO SAVEPOINT binary_copy")
+        print_color(f"  ⚠ Binary COPY rejected ({str(e).splitlines()[0]}), using text COPY", Colors.YELLOW)
+        copy_rows(cursor, table, columns, rows)
+    else:
+        cursor.execute("RELEASE SAVEPOINT binary_copy")
+
+def seed_owners(conn_params, count=1000, conn=None, server_side=False):
     """Seed pet owners"""
-    conn = get_connection(conn_params)
-    if not conn:
-        return False
+    owns_conn = conn is None
+    if owns_conn:
+        conn = get_connection(conn_params)
+        if not conn:
+            return False
     
     try:
         cursor = conn.cursor()
         
-        batch_size = 100
-        for i in range(0, count, batch_size):
-            batch = min(batch_size, count - i)
-            values = []
-            
-            for _ in range(batch):
-                first_name = choice(FIRST_NAMES)
-                last_name = choice(LAST_NAMES)
-                address = f"{randint(100, 9999)} {choice(STREET_NAMES)}"
-                city = choice(CITIES)
-                phone = f"{randint(100, 999)}{randint(100, 999)}{randint(1000, 9999)}"
-                
-                values.append((first_name, last_name, address, city, phone))
-            
-            cursor.executemany(
-                """INSERT INTO owners (first_name, last_name, address, city, telephone) 
-                   VALUES (%s, %s, %s, %s, %s)""",
-                values
-            )
+        if server_side:
+            cursor.execute(OWNERS_SERIES_SQL, {
+                'first_names': FIRST_NAMES, 'last_names': LAST_NAMES,
+                'streets': STREET_NAMES, 'cities': CITIES, 'count': count
+            })
+            _ID_CACHE.pop('owners', None)
+        else:
+            pool = owner_pool()
+            owner_ids = reserve_ids(cursor, 'owners', count)
+            picks = RNG.integers(0, len(pool), size=count).tolist()
+            values = [(owner_id,) + pool[i] for owner_id, i in zip(owner_ids, picks)]
             
-            if (i + batch) % 100 == 0:
-                print(f"  Inserted {i + batch}/{count} owners...")
+            copy_rows(cursor, 'owners', ('id', 'first_name', 'last_name', 'address', 'city', 'telephone'), values)
+            remember_ids('owners', owner_ids)
         
-        conn.commit()
+        # A caller-supplied connection is committed by the caller
+        if owns_conn:
+            conn.commit()
         print_color(f"  ✓ Seeded {count} owners", Colors.GREEN)
         return True
         
@@ -289,51 +544,50 @@ def seed_owners(conn_params, count=1000):
         return False
     finally:
         cursor.close()
-        conn.close()
+        if owns_conn:
+            conn.close()
 
-def seed_pets(conn_params, count=2000):
+def seed_pets(conn_params, count=2000, conn=None, server_side=False):
     """Seed pets (linked to owners)"""
-    conn = get_connection(conn_params)
-    if not conn:
-        return False
+    owns_conn = conn is None
+    if owns_conn:
+        conn = get_connection(conn_params)
+        if not conn:
+            return False
     
     try:
         cursor = conn.cursor()
         
-        # Get available owner IDs and type IDs
-        cursor.execute("SELECT id FROM owners")
-        owner_ids = [row[0] for row in cursor.fetchall()]
-        
-        cursor.execute("SELECT id FROM types")
-        type_ids = [row[0] for row in cursor.fetchall()]
+        if server_side:
+            cursor.execute(PETS_SERIES_SQL, {'pet_names': PET_NAMES, 'count': count})
+            seeded = cursor.rowcount > 0
+            _ID_CACHE.pop('pets', None)
+        else:
+            # Get available owner IDs and type IDs
+            owner_ids = cached_ids(cursor, 'owners')
+            type_ids = cached_ids(cursor, 'types')
+            
+            seeded = bool(owner_ids and type_ids)
+            if seeded:
+                pet_ids = reserve_ids(cursor, 'pets', count)
+                values = zip(
+                    pet_ids,
+                    RNG.choice(PET_NAMES, size=count).tolist(),
+                    random_dates(2010, 2023, count).tolist(),
+                    RNG.choice(type_ids, size=count).tolist(),
+                    RNG.choice(owner_ids, size=count).tolist()
+                )
+                
+                copy_rows_binary(cursor, 'pets', ('id', 'name', 'birth_date', 'type_id', 'owner_id'), values)
+                remember_ids('pets', pet_ids)
         
-        if not owner_ids or not type_ids:
+        if not seeded:
             print_color("  ✗ No owners or types found. Please seed owners and types first.", Colors.RED)
             return False
         
-        batch_size = 100
-        for i in range(0, count, batch_size):
-            batch = min(batch_size, count - i)
-            values = []
-            
-            for _ in range(batch):
-                name = choice(PET_NAMES)
-                birth_date = f"20{randint(10, 23):02d}-{randint(1, 12):02d}-{randint(1, 28):02d}"
-                type_id = choice(type_ids)
-                owner_id = choice(owner_ids)
-                
-                values.append((name, birth_date, type_id, owner_id))
-            
-            cursor.executemany(
-                """INSERT INTO pets (name, birth_date, type_id, owner_id) 
-                   VALUES (%s, %s, %s, %s)""",
-                values
-            )
-            
-            if (i + batch) % 200 == 0:
-                print(f"  Inserted {i + batch}/{count} pets...")
-        
-        conn.commit()
+        # A caller-supplied connection is committed by the caller
+        if owns_conn:
+            conn.commit()
         print_color(f"  ✓ Seeded {count} pets", Colors.GREEN)
         return True
         
@@ -343,13 +597,16 @@ def seed_pets(conn_params, count=2000):
         return False
     finally:
         cursor.close()
-        conn.close()
+        if owns_conn:
+            conn.close()
 
-def seed_vets(conn_params, count=50):
+def seed_vets(conn_params, count=50, conn=None):
     """Seed veterinarians"""
-    conn = get_connection(conn_params)
-    if not conn:
-        return False
+    owns_conn = conn is None
+    if owns_conn:
+        conn = get_connection(conn_params)
+        if not conn:
+            return False
     
     try:
         cursor = conn.cursor()
@@ -360,12 +617,17 @@ def seed_vets(conn_params, count=50):
             last_name = choice(LAST_NAMES)
             values.append((first_name, last_name))
         
-        cursor.executemany(
-            "INSERT INTO vets (first_name, last_name) VALUES (%s, %s)",
-            values
+        ids = execute_values(
+            cursor,
+            "INSERT INTO vets (first_name, last_name) VALUES %s RETURNING id",
+            values,
+            fetch=True
         )
+        remember_ids('vets', [row[0] for row in ids])
         
-        conn.commit()
+        # A caller-supplied connection is committed by the caller
+        if owns_conn:
+            conn.commit()
         print_color(f"  ✓ Seeded {count} vets", Colors.GREEN)
         return True
         
@@ -375,23 +637,23 @@ def seed_vets(conn_params, count=50):
         return False
     finally:
         cursor.close()
-        conn.close()
+        if owns_conn:
+            conn.close()
 
-def seed_vet_specialties(conn_params):
+def seed_vet_specialties(conn_params, conn=None):
     """Link vets to specialties (many-to-many relationship)"""
-    conn = get_connection(conn_params)
-    if not conn:
-        return False
+    owns_conn = conn is None
+    if owns_conn:
+        conn = get_connection(conn_params)
+        if not conn:
+            return False
     
     try:
         cursor = conn.cursor()
         
         # Get available vet and specialty IDs
-        cursor.execute("SELECT id FROM vets")
-        vet_ids = [row[0] for row in cursor.fetchall()]
-        
-        cursor.execute("SELECT id FROM specialties")
-        specialty_ids = [row[0] for row in cursor.fetchall()]
+        vet_ids = cached_ids(cursor, 'vets')
+        specialty_ids = cached_ids(cursor, 'specialties')
         
         if not vet_ids or not specialty_ids:
             print_color("  ✗ No vets or specialties found. Please seed vets and specialties first.", Colors.RED)
@@ -406,12 +668,17 @@ def seed_vet_specialties(conn_params):
             for specialty_id in assigned_specialties:
                 values.append((vet_id, specialty_id))
         
-        cursor.executemany(
-            "INSERT INTO vet_specialties (vet_id, specialty_id) VALUES (%s, %s) ON CONFLICT DO NOTHING",
-            values
+        # One multi-row INSERT instead of a round trip per association
+        execute_values(
+            cursor,
+            "INSERT INTO vet_specialties (vet_id, specialty_id) VALUES %s ON CONFLICT DO NOTHING",
+            values,
+            page_size=max(len(values), 1)
         )
         
-        conn.commit()
+        # A caller-supplied connection is committed by the caller
+        if owns_conn:
+            conn.commit()
         print_color(f"  ✓ Seeded {len(values)} vet-specialty associations", Colors.GREEN)
         return True
         
@@ -421,53 +688,44 @@ def seed_vet_specialties(conn_params):
         return False
     finally:
         cursor.close()
-        conn.close()
+        if owns_conn:
+            conn.close()
 
-def seed_visits(conn_params, count=5000):
+def seed_visits(conn_params, count=5000, conn=None, server_side=False):
     """Seed pet visits"""
-    conn = get_connection(conn_params)
-    if not conn:
-        return False
+    owns_conn = conn is None
+    if owns_conn:
+        conn = get_connection(conn_params)
+        if not conn:
+            return False
     
     try:
         cursor = conn.cursor()
         
-        # Get available pet IDs
-        cursor.execute("SELECT id FROM pets")
-        pet_ids = [row[0] for row in cursor.fetchall()]
+        if server_side:
+            cursor.execute(VISITS_SERIES_SQL, {'descriptions': VISIT_DESCRIPTIONS, 'count': count})
+            seeded = cursor.rowcount > 0
+        else:
+            # Get available pet IDs
+            pet_ids = cached_ids(cursor, 'pets')
+            
+            seeded = bool(pet_ids)
+            if seeded:
+                values = zip(
+                    RNG.choice(pet_ids, size=count).tolist(),
+                    random_dates(2020, 2024, count).tolist(),
+                    RNG.choice(VISIT_DESCRIPTIONS, size=count).tolist()
+                )
+                
+                copy_rows_binary(cursor, 'visits', ('pet_id', 'visit_date', 'description'), values)
         
-        if not pet_ids:
+        if not seeded:
             print_color("  ✗ No pets found. Please seed pets first.", Colors.RED)
             return False
         
-        descriptions = [
-            'Annual checkup', 'Vaccination', 'Dental cleaning', 'Surgery consultation',
-            'Skin condition', 'Weight check', 'Behavior consultation', 'Emergency visit',
-            'Follow-up examination', 'Routine care'
-        ]
-        
-        batch_size = 200
-        for i in range(0, count, batch_size):
-            batch = min(batch_size, count - i)
-            values = []
-            
-            for _ in range(batch):
-                pet_id = choice(pet_ids)
-                visit_date = f"20{randint(20, 24):02d}-{randint(1, 12):02d}-{randint(1, 28):02d}"
-                description = choice(descriptions)
-                
-                values.append((pet_id, visit_date, description))
-            
-            cursor.executemany(
-                """INSERT INTO visits (pet_id, visit_date, description) 
-                   VALUES (%s, %s, %s)""",
-                values
-            )
-            
-            if (i + batch) % 500 == 0:
-                print(f"  Inserted {i + batch}/{count} visits...")
-        
-        conn.commit()
+        # A caller-supplied connection is committed by the caller
+        if owns_conn:
+            conn.commit()
         print_color(f"  ✓ Seeded {count} visits", Colors.GREEN)
         return True
         
@@ -477,28 +735,151 @@ def seed_visits(conn_params, count=5000):
         return False
     finally:
         cursor.close()
-        conn.close()
+        if owns_conn:
+            conn.close()
 
-def seed_all_tables(conn_params):
-    """Seed all PetClinic tables with test data"""
+def seed_all_tables(conn_params, mode='copy', parallel=False):
+    """Seed all PetClinic tables with test data
+    
+    mode 'copy' generates rows client-side and streams them with COPY;
+    mode 'server' generates owners, pets and visits inside PostgreSQL.
+    parallel runs independent seeders concurrently on separate connections.
+    """
     print_header("Seeding Database with Test Data")
+    server_side = mode == 'server'
+    
+    if parallel:
+        return seed_all_tables_parallel(conn_params, server_side)
+    
+    # One connection is shared by every seeder to avoid a handshake per table
+    conn = get_connection(conn_params)
+    if not conn:
+        return False
     
     # Seed in correct order (respecting foreign keys)
     steps = [
-        ("Types", lambda: seed_types(conn_params, 6)),
-        ("Specialties", lambda: seed_specialties(conn_params, 6)),
-        ("Owners", lambda: seed_owners(conn_params, 1000)),
-        ("Pets", lambda: seed_pets(conn_params, 2000)),
-        ("Vets", lambda: seed_vets(conn_params, 50)),
-        ("Vet Specialties", lambda: seed_vet_specialties(conn_params)),
-        ("Visits", lambda: seed_visits(conn_params, 5000))
+        ("Types", lambda: seed_types(conn_params, 6, conn=conn)),
+        ("Specialties", lambda: seed_specialties(conn_params, 6, conn=conn)),
+        ("Owners", lambda: seed_owners(conn_params, 1000, conn=conn, server_side=server_side)),
+        ("Pets", lambda: seed_pets(conn_params, 2000, conn=conn, server_side=server_side)),
+        ("Vets", lambda: seed_vets(conn_params, 50, conn=conn)),
+        ("Vet Specialties", lambda: seed_vet_specialties(conn_params, conn=conn)),
+        ("Visits", lambda: seed_visits(conn_params, 5000, conn=conn, server_side=server_side))
     ]
     
-    for name, func in steps:
-        print(f"\nSeeding {name}...")
-        if not func():
-            print_color(f"Failed to seed {name}. Stopping.", Colors.RED)
-            return False
+    # All steps run in one transaction: secondary indexes are dropped up front,
+    # rebuilt once after the load, and any failure rolls the whole seed back
+    try:
+        with conn.cursor() as cursor:
+            # Seed data is regenerable, so the final commit need not wait for the WAL flush
+            cursor.execute("SET LOCAL synchronous_commit = off")
+            # Look up pre-existing parent IDs once; seeders extend the cache from here
+            load_id_cache(cursor)
+            cursor.execute("SAVEPOINT drop_indexes")
+            try:
+                index_defs = drop_secondary_indexes(cursor, SEED_TABLES)
+                cursor.execute("RELEASE SAVEPOINT drop_indexes")
+                print(f"  Dropped {len(index_defs)} secondary indexes for the bulk load")
+            except psycopg2.errors.InsufficientPrivilege:
+                # Only the table owner may drop indexes; seed with them in place
+                cursor.execute("ROLLBACK TO SAVEPOINT drop_indexes")
+                print_color("  DROP INDEX not permitted, seeding with indexes in place", Colors.YELLOW)
+                index_defs = []
+        
+        for name, func in steps:
+            print(f"\nSeeding {name}...")
+            if not func():
+                print_color(f"Failed to seed {name}. Stopping.", Colors.RED)
+                conn.rollback()
+                _ID_CACHE.clear()
+                return False
+        
+        with conn.cursor() as cursor:
+            for index_def in index_defs:
+                cursor.execute(index_def)
+            # One ANALYZE per table: a table list needs PostgreSQL 11+
+            cursor.execute(sql.SQL(' ').join(
+                sql.SQL("ANALYZE {};").format(sql.Identifier(table)) for table in SEED_TABLES))
+        conn.commit()
+        if index_defs:
+            print(f"\n  Rebuilt {len(index_defs)} indexes and refreshed table statistics")
+        else:
+            print("\n  Refreshed table statistics")
+    except psycopg2.Error as e:
+        conn.rollback()
+        _ID_CACHE.clear()
+        print_color(f"  ✗ Seeding error: {e}", Colors.RED)
+        return False
+    finally:
+        conn.close()
+    
+    print()
+    print_color("✓ All tables seeded successfully!", Colors.GREEN)
+    return True
+
+def _seed_on_pooled_conn(pool, name, func, **kwargs):
+    """Run one seeder on a pooled connection and commit its work"""
+    conn = pool.getconn()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SET LOCAL synchronous_commit = off")
+        if not func(None, conn=conn, **kwargs):
+            conn.rollback()
+            return name, False
+        conn.commit()
+        return name, True
+    except psycopg2.Error as e:
+        conn.rollback()
+        print_color(f"  ✗ Error seeding {name}: {e}", Colors.RED)
+        return name, False
+    finally:
+        pool.putconn(conn)
+
+def seed_all_tables_parallel(conn_params, server_side=False):
+    """Seed independent tables concurrently, one tier at a time"""
+    # Each tier only depends on the tiers before it
+    tiers = [
+        [("Types", seed_types, {'count': 6}),
+         ("Specialties", seed_specialties, {'count': 6}),
+         ("Owners", seed_owners, {'count': 1000, 'server_side': server_side}),
+         ("Vets", seed_vets, {'count': 50})],
+        [("Pets", seed_pets, {'count': 2000, 'server_side': server_side}),
+         ("Vet Specialties", seed_vet_specialties, {})],
+        [("Visits", seed_visits, {'count': 5000, 'server_side': server_side})]
+    ]
+    
+    try:
+        pool = ThreadedConnectionPool(1, max(len(tier) for tier in tiers), **conn_params)
+    except psycopg2.Error as e:
+        print_color(f"  ✗ Database connection error: {e}", Colors.RED)
+        return False
+    
+    try:
+        # Look up pre-existing parent IDs once; seeders extend the cache from here
+        conn = pool.getconn()
+        try:
+            with conn.cursor() as cursor:
+                load_id_cache(cursor)
+            conn.commit()
+        finally:
+            pool.putconn(conn)
+        
+        with ThreadPoolExecutor(max_workers=len(tiers[0])) as executor:
+            for tier in tiers:
+                print(f"\nSeeding {', '.join(name for name, _, _ in tier)}...")
+                futures = [executor.submit(_seed_on_pooled_conn, pool, name, func, **kwargs)
+                           for name, func, kwargs in tier]
+                failed = [name for name, ok in (future.result() for future in futures) if not ok]
+                if failed:
+                    print_color(f"Failed to seed {', '.join(failed)}. Stopping.", Colors.RED)
+                    _ID_CACHE.clear()
+                    return False
+    except psycopg2.Error as e:
+        print_color(f"  ✗ Seeding error: {e}", Colors.RED)
+        _ID_CACHE.clear()
+        return False
+    finally:
+        pool.closeall()
     
     print()
     print_color("✓ All tables seeded successfully!", Colors.GREEN)
@@ -541,29 +922,41 @@ def run_jmeter_test(env_config, results_dir, timeout=600):
     print()
     print_color("  Starting JMeter test...", Colors.YELLOW)
     
+    # Stream JMeter output instead of buffering it until the run finishes
+    summary_lines = []
+    output_tail = deque(maxlen=20)
+    
+    def read_output(stream):
+        for line in stream:
+            if 'summary =' in line:
+                summary_lines.append(line)
+            output_tail.append(line)
+    
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+        reader = threading.Thread(target=read_output, args=(proc.stdout,), daemon=True)
+        reader.start()
         
-        if result.returncode == 0:
+        try:
+            returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            reader.join(timeout=5)
+        
+        if returncode == 0:
             print_color("  ✓ JMeter test completed successfully", Colors.GREEN)
             
-            # Parse JMeter log for summary
-            try:
-                with open(log_file, 'r') as f:
-                    log_content = f.read()
-                    if 'summary =' in log_content:
-                        summary_lines = [line for line in log_content.split('\n') if 'summary =' in line]
-                        if summary_lines:
-                            print()
-                            print_color("  Test Summary:", Colors.CYAN)
-                            for line in summary_lines[-1:]:
-                                print(f"    {line.split('summary =')[1].strip()}")
-            except Exception:
-                pass
+            if summary_lines:
+                print()
+                print_color("  Test Summary:", Colors.CYAN)
+                print(f"    {summary_lines[-1].split('summary =')[1].strip()}")
         else:
-            print_color(f"  ✗ JMeter test failed with return code {result.returncode}", Colors.RED)
-            if result.stderr:
-                print(f"    Error: {result.stderr[:200]}")
+            print_color(f"  ✗ JMeter test failed with return code {returncode}", Colors.RED)
+            if output_tail:
+                print(f"    Error: {''.join(output_tail)[-200:]}")
     
     except subprocess.TimeoutExpired:
         print_color("  ✗ JMeter test timed out", Colors.RED)
@@ -573,12 +966,63 @@ def run_jmeter_test(env_config, results_dir, timeout=600):
     print()
     return jtl_file, report_dir
 
+# Column names follow typeperf's counters so both outputs share one graphing path
+PSUTIL_CSV_HEADER = ('Timestamp', '% Processor Time', '% Committed Bytes In Use',
+                     'Disk Reads/sec', 'Disk Writes/sec', 'Bytes Total/sec')
+
+class PerformanceMonitor(threading.Thread):
+    """Sample system counters with psutil once per interval and append them to a CSV file"""
+    
+    def __init__(self, perf_file, interval=1.0):
+        super().__init__(daemon=True)
+        self.perf_file = perf_file
+        self.interval = interval
+        self.stop_event = threading.Event()
+    
+    def run(self):
+        psutil.cpu_percent(interval=None)  # Prime the CPU counter
+        disk = psutil.disk_io_counters()
+        net = psutil.net_io_counters()
+        last = time.monotonic()
+        
+        with open(self.perf_file, 'w', encoding='utf-8', newline='', buffering=1) as f:
+            f.write(','.join(PSUTIL_CSV_HEADER) + '\n')
+            while not self.stop_event.wait(self.interval):
+                now = time.monotonic()
+                elapsed = (now - last) or self.interval
+                new_disk = psutil.disk_io_counters()
+                new_net = psutil.net_io_counters()
+                
+                disk_reads = disk_writes = 0.0
+                if disk and new_disk:
+                    disk_reads = (new_disk.read_count - disk.read_count) / elapsed
+                    disk_writes = (new_disk.write_count - disk.write_count) / elapsed
+                net_bytes = ((new_net.bytes_sent + new_net.bytes_recv)
+                             - (net.bytes_sent + net.bytes_recv)) / elapsed
+                
+                f.write(f"{datetime.now().strftime('%m/%d/%Y %H:%M:%S.%f')[:-3]},"
+                        f"{psutil.cpu_percent(interval=None):.2f},{psutil.virtual_memory().percent:.2f},"
+                        f"{disk_reads:.2f},{disk_writes:.2f},{net_bytes:.2f}\n")
+                disk, net, last = new_disk, new_net, now
+    
+    def stop(self, timeout=3):
+        self.stop_event.set()
+        self.join(timeout=timeout)
+
 def start_performance_monitoring(perf_file):
-    """Start Windows performance monitoring"""
+    """Start system performance monitoring (psutil thread, or typeperf on Windows without psutil)"""
     print_header("[Step 3/7] Starting Performance Monitoring")
     
+    if PSUTIL_AVAILABLE:
+        monitor = PerformanceMonitor(perf_file)
+        monitor.start()
+        print_color("  ✓ Performance monitoring started (psutil)", Colors.GREEN)
+        print(f"    Output file: {perf_file}")
+        print()
+        return monitor
+    
     if os.name != 'nt':
-        print_color("  ⚠ Performance monitoring only available on Windows", Colors.YELLOW)
+        print_color("  ⚠ Performance monitoring needs psutil (pip install psutil) or Windows typeperf", Colors.YELLOW)
         return None
     
     try:
@@ -613,6 +1057,12 @@ def stop_performance_monitoring(proc):
         print()
         return
     
+    if isinstance(proc, PerformanceMonitor):
+        proc.stop()
+        print_color("  ✓ Performance monitoring stopped", Colors.GREEN)
+        print()
+        return
+    
     try:
         # Try graceful shutdown first
         if os.name == 'nt':
@@ -646,16 +1096,16 @@ def stop_performance_monitoring(proc):
 
 def clean_csv(file_path):
     """Clean Windows typeperf CSV output"""
-    with open(file_path, 'r', encoding='utf-16') as f:
-        lines = f.readlines()
+    # Decode the whole file in one pass rather than building a list of lines
+    text = file_path.read_bytes().decode('utf-16')
     
     # Remove first line (PDH header)
-    if lines and lines[0].startswith('"(PDH-CSV'):
-        lines = lines[1:]
+    if text.startswith('"(PDH-CSV'):
+        newline = text.find('\n')
+        text = text[newline + 1:] if newline != -1 else ''
     
     clean_file = file_path.with_suffix('.clean.csv')
-    with open(clean_file, 'w', encoding='utf-8') as f:
-        f.writelines(lines)
+    clean_file.write_bytes(text.encode('utf-8'))
     
     return clean_file
 
@@ -666,61 +1116,77 @@ def generate_performance_graphs(perf_csv, output_file):
         return
     
     try:
-        df = pd.read_csv(perf_csv)
-        df.columns = df.columns.str.strip('"')
-        df['Timestamp'] = pd.to_datetime(df.iloc[:, 0], format='%m/%d/%Y %H:%M:%S.%f')
+        # Resolve the counter columns from the header once
+        header = pd.read_csv(perf_csv, nrows=0).columns
+        time_col = header[0]
+        cpu_col = next(col for col in header if 'Processor Time' in col)
+        mem_col = next(col for col in header if 'Committed Bytes In Use' in col)
+        disk_read = next(col for col in header if 'Disk Reads' in col)
+        disk_write = next(col for col in header if 'Disk Writes' in col)
+        net_cols = [col for col in header if 'Bytes Total/sec' in col]
+        metric_cols = [cpu_col, mem_col, disk_read, disk_write] + net_cols
+        
+        # Parse timestamps and float32 counters in a single pass
+        df = pd.read_csv(
+            perf_csv,
+            usecols=[time_col] + metric_cols,
+            parse_dates=[time_col],
+            date_format='%m/%d/%Y %H:%M:%S.%f',
+            dtype=dict.fromkeys(metric_cols, 'float32'),
+            na_values=[' ']
+        )
+        
+        # Averages use every sample; plotting is capped at ~2000 points per series
+        cpu_avg = df[cpu_col].mean()
+        mem_avg = df[mem_col].mean()
+        df = df.iloc[::max(1, len(df) // 2000)]
+        timestamps = df[time_col]
         
         fig, axes = plt.subplots(2, 2, figsize=(15, 10))
         fig.suptitle('System Performance During Test', fontsize=16)
         
         # CPU Usage
-        cpu_col = [col for col in df.columns if 'Processor Time' in col][0]
-        axes[0, 0].plot(df['Timestamp'], df[cpu_col], label='CPU Usage', color='blue')
-        axes[0, 0].axhline(y=df[cpu_col].mean(), color='r', linestyle='--', label=f'Avg: {df[cpu_col].mean():.1f}%')
-        axes[0, 0].fill_between(df['Timestamp'], df[cpu_col], alpha=0.3)
+        axes[0, 0].plot(timestamps, df[cpu_col], label='CPU Usage', color='blue', rasterized=True)
+        axes[0, 0].axhline(y=cpu_avg, color='r', linestyle='--', label=f'Avg: {cpu_avg:.1f}%')
         axes[0, 0].set_ylabel('CPU %')
         axes[0, 0].set_title('CPU Usage')
         axes[0, 0].legend()
         axes[0, 0].grid(True)
         
         # Memory Usage
-        mem_col = [col for col in df.columns if 'Committed Bytes In Use' in col][0]
-        axes[0, 1].plot(df['Timestamp'], df[mem_col], label='Memory Usage', color='green')
-        axes[0, 1].axhline(y=df[mem_col].mean(), color='r', linestyle='--', label=f'Avg: {df[mem_col].mean():.1f}%')
-        axes[0, 1].fill_between(df['Timestamp'], df[mem_col], alpha=0.3)
+        axes[0, 1].plot(timestamps, df[mem_col], label='Memory Usage', color='green', rasterized=True)
+        axes[0, 1].axhline(y=mem_avg, color='r', linestyle='--', label=f'Avg: {mem_avg:.1f}%')
         axes[0, 1].set_ylabel('Memory %')
         axes[0, 1].set_title('Memory Usage')
         axes[0, 1].legend()
         axes[0, 1].grid(True)
         
         # Disk I/O
-        disk_read = [col for col in df.columns if 'Disk Reads' in col][0]
-        disk_write = [col for col in df.columns if 'Disk Writes' in col][0]
-        axes[1, 0].plot(df['Timestamp'], df[disk_read], label='Reads', color='orange')
-        axes[1, 0].plot(df['Timestamp'], df[disk_write], label='Writes', color='purple')
+        axes[1, 0].plot(timestamps, df[disk_read], label='Reads', color='orange', rasterized=True)
+        axes[1, 0].plot(timestamps, df[disk_write], label='Writes', color='purple', rasterized=True)
         axes[1, 0].set_ylabel('Operations/sec')
         axes[1, 0].set_title('Disk I/O')
         axes[1, 0].legend()
         axes[1, 0].grid(True)
         
         # Network Activity
-        net_cols = [col for col in df.columns if 'Bytes Total/sec' in col]
         if net_cols:
             net_data = df[net_cols].sum(axis=1) / 1024 / 1024  # Convert to MB/s
-            axes[1, 1].plot(df['Timestamp'], net_data, label='Network', color='red')
+            axes[1, 1].plot(timestamps, net_data, label='Network', color='red', rasterized=True)
             axes[1, 1].set_ylabel('MB/s')
             axes[1, 1].set_title('Network Activity')
             axes[1, 1].legend()
             axes[1, 1].grid(True)
         
-        plt.tight_layout()
-        plt.savefig(output_file, dpi=150, bbox_inches='tight')
+        # Fixed margins avoid the extra layout passes of tight_layout/bbox_inches='tight'
+        fig.subplots_adjust(left=0.06, right=0.98, bottom=0.06, top=0.92, hspace=0.25, wspace=0.15)
+        fig.savefig(output_file, dpi=150)
         print_color(f"  ✓ Performance graphs saved: {output_file}", Colors.GREEN)
-        plt.close()
+        plt.close(fig)
     except Exception as e:
         print_color(f"  ✗ Error generating graphs: {e}", Colors.RED)
 
-def process_performance_data(perf_file, results_dir):
+def process_performance_data(perf_file, results_dir, needs_cleaning=True):
     """Process and graph performance data"""
     print_header("[Step 6/7] Processing Performance Data")
     
@@ -730,8 +1196,12 @@ def process_performance_data(perf_file, results_dir):
         return
     
     try:
-        clean_file = clean_csv(perf_file)
-        print_color(f"  ✓ Cleaned performance data: {clean_file}", Colors.GREEN)
+        # psutil output is already plain UTF-8 CSV; only typeperf output needs cleaning
+        if needs_cleaning:
+            clean_file = clean_csv(perf_file)
+            print_color(f"  ✓ Cleaned performance data: {clean_file}", Colors.GREEN)
+        else:
+            clean_file = perf_file
         
         graph_file = results_dir / f"performance_graphs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
         generate_performance_graphs(clean_file, graph_file)
@@ -781,6 +1251,12 @@ Examples:
   # Skip database seeding (reuse existing data)
   python run_and_monitor_db_test.py --env target --no-seed
   
+  # Generate seed data inside PostgreSQL
+  python run_and_monitor_db_test.py --env target --seed-mode server
+  
+  # Seed independent tables concurrently
+  python run_and_monitor_db_test.py --env target --parallel-seed
+  
   # Cleanup only
   python run_and_monitor_db_test.py --env target --cleanup
         """)
@@ -795,13 +1271,19 @@ Examples:
                        help='Skip system performance profiling')
     parser.add_argument('--no-seed', action='store_true',
                        help='Skip database seeding')
+    parser.add_argument('--seed-mode', choices=['copy', 'server'], default='copy',
+                       help='Generate seed rows client-side and COPY them (copy) or inside PostgreSQL '
+                            'with generate_series (server) (default: copy)')
+    parser.add_argument('--parallel-seed', action='store_true',
+                       help='Seed independent tables concurrently on separate connections '
+                            '(commits per table instead of one transaction)')
     parser.add_argument('--timeout', type=int, default=1800,
                        help='JMeter test timeout in seconds (default: 1800)')
     
     args = parser.parse_args()
     
     # Load from configuration file
-    conn_params, database_name = get_connection_from_config(
+    conn_params, database_name, env_config = get_connection_from_config(
         args.environment, 
         Path(args.config)
     )
@@ -809,10 +1291,6 @@ Examples:
         print("\nFailed to load configuration. Exiting.")
         sys.exit(1)
     
-    # Load environment config for JMeter
-    config = load_config(Path(args.config))
-    env_config = config['environments'][args.environment]
-    
     # If cleanup flag is set, run cleanup and exit
     if args.cleanup:
         cleanup_database(conn_params)
@@ -837,7 +1315,7 @@ Examples:
     
     # Step 3: Seeding (unless skipped)
     if not args.no_seed:
-        if not seed_all_tables(conn_params):
+        if not seed_all_tables(conn_params, mode=args.seed_mode, parallel=args.parallel_seed):
             print_color("\nDatabase seeding failed. Exiting.", Colors.RED)
             sys.exit(1)
     
@@ -847,7 +1325,7 @@ Examples:
     # Performance monitoring (if enabled)
     perf_proc = None
     perf_file = None
-    if not args.no_profiling and os.name == 'nt':
+    if not args.no_profiling and (PSUTIL_AVAILABLE or os.name == 'nt'):
         perf_file = JMETER_RESULTS_DIR / f"performance_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         perf_proc = start_performance_monitoring(perf_file)
         time.sleep(2)  # Let monitoring stabilize
@@ -861,7 +1339,8 @@ Examples:
     
     # Process performance data
     if perf_file and not args.no_profiling:
-        process_performance_data(perf_file, JMETER_RESULTS_DIR)
+        process_performance_data(perf_file, JMETER_RESULTS_DIR,
+                                 needs_cleaning=not isinstance(perf_proc, PerformanceMonitor))
     
     # Consolidate results
     consolidate_results(jtl_file, report_dir, perf_file)
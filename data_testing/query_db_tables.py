@@ -1,28 +1,45 @@
 """
 Query database tables from PetClinic PostgreSQL database
 """
-import psycopg2
-import json
+from psycopg2 import sql
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
+import sys
 
-def load_config(config_path="db_config.json", env_name="target"):
-    """Load database configuration from JSON file"""
-    with open(config_path, 'r') as f:
-        config = json.load(f)
-    return config['environments'][env_name]
+# Shared config loader and connection pool live at the repository root
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from db_pool import load_config, pooled_connection
+
+# Concurrent COUNT(*) queries for --exact (the shared pool allows up to 10 connections)
+COUNT_WORKERS = 8
+
+def get_db_params(env_config):
+    """Build psycopg2 connection parameters from environment config"""
+    return {
+        'host': env_config['host'],
+        'port': env_config['port'],
+        'database': env_config['database'],
+        'user': env_config['username'],
+        'password': env_config['password']
+    }
 
 def get_connection(env_config):
-    """Create PostgreSQL connection from environment config"""
-    return psycopg2.connect(
-        host=env_config['host'],
-        port=env_config['port'],
-        database=env_config['database'],
-        user=env_config['username'],
-        password=env_config['password']
-    )
+    """Borrow a pooled PostgreSQL connection for the environment config"""
+    return pooled_connection(get_db_params(env_config))
+
+def count_rows(db_params, schema, table):
+    """Exact COUNT(*) for one table on its own pooled connection"""
+    with pooled_connection(db_params) as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(sql.SQL("SELECT COUNT(*) FROM {}.{}").format(
+                sql.Identifier(schema), sql.Identifier(table)))
+            return schema, table, cursor.fetchone()[0]
 
-def query_tables(env_name="target", config_path="db_config.json"):
+def query_tables(env_name="target", config_path="db_config.json", exact=False,
+                 schema=None, table_pattern=None, show_columns=True, show_counts=True):
     """Query all tables from the database"""
     try:
         # Load configuration
@@ -32,82 +49,136 @@ def query_tables(env_name="target", config_path="db_config.json"):
         print(f"Database: {env_config['database']}")
         print(f"Host: {env_config['host']}\n")
         
-        conn = get_connection(env_config)
-        cursor = conn.cursor()
-        
-        # Get all tables (PostgreSQL version)
-        query = """
-            SELECT 
-                table_schema, 
-                table_name,
-                (SELECT COUNT(*) 
-                 FROM information_schema.columns c 
-                 WHERE c.table_schema = t.table_schema 
-                   AND c.table_name = t.table_name) as column_count
-            FROM information_schema.tables t
-            WHERE table_type = 'BASE TABLE'
-              AND table_schema NOT IN ('pg_catalog', 'information_schema')
-            ORDER BY table_schema, table_name
-        """
-        
-        cursor.execute(query)
-        tables = cursor.fetchall()
-        
-        print("\n" + "="*70)
-        print(f"DATABASE: {env_config['database']}")
-        print(f"HOST: {env_config.get('host', 'N/A')}")
-        print("="*70)
-        print(f"\nTotal Tables Found: {len(tables)}\n")
-        
-        for row in tables:
-            print(f"  {row[0]}.{row[1]:<40} ({row[2]} columns)")
-        
-        print("\n" + "="*70)
-        print("Getting detailed column information for each table...")
-        print("="*70 + "\n")
-        
-        for row in tables:
-            schema = row[0]
-            table = row[1]
+        with get_connection(env_config) as conn:
+            cursor = conn.cursor()
             
-            # Get columns for this table (PostgreSQL version)
-            cursor.execute("""
+            # Get all tables from the system catalogs (information_schema views are much slower),
+            # along with the OID and row estimate the later passes need, in one round trip
+            query = """
                 SELECT 
-                    column_name,
-                    data_type,
-                    character_maximum_length,
-                    is_nullable,
-                    column_default
-                FROM information_schema.columns
-                WHERE table_schema = %s AND table_name = %s
-                ORDER BY ordinal_position
-            """, (schema, table))
+                    n.nspname, 
+                    c.relname,
+                    (SELECT COUNT(*) 
+                     FROM pg_attribute a 
+                     WHERE a.attrelid = c.oid 
+                       AND a.attnum > 0 
+                       AND NOT a.attisdropped
+                       AND (pg_has_role(c.relowner, 'USAGE')
+                            OR has_column_privilege(c.oid, a.attnum, 'SELECT, INSERT, UPDATE, REFERENCES'))) as column_count,
+                    c.oid,
+                    c.reltuples::bigint
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE c.relkind IN ('r', 'p')
+                  AND c.relpersistence <> 't'
+                  AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+                  AND n.nspname NOT LIKE 'pg_toast%%'
+                  -- Same visibility rule as information_schema.tables
+                  AND (pg_has_role(c.relowner, 'USAGE')
+                       OR has_table_privilege(c.oid, 'SELECT, INSERT, UPDATE, DELETE, TRUNCATE, REFERENCES, TRIGGER')
+                       OR has_any_column_privilege(c.oid, 'SELECT, INSERT, UPDATE, REFERENCES'))
+                  AND (%(schema)s::text IS NULL OR n.nspname = %(schema)s)
+                  AND (%(table_pattern)s::text IS NULL OR c.relname LIKE %(table_pattern)s)
+                ORDER BY n.nspname, c.relname
+            """
             
-            columns = cursor.fetchall()
+            cursor.execute(query, {'schema': schema, 'table_pattern': table_pattern})
+            tables = cursor.fetchall()
             
-            print(f"\n{schema}.{table}")
-            print("-" * 70)
-            for col in columns:
-                col_name = col[0]
-                data_type = col[1]
-                max_len = f"({col[2]})" if col[2] else ""
-                nullable = "NULL" if col[3] == "YES" else "NOT NULL"
-                default = f" DEFAULT {col[4]}" if col[4] else ""
-                print(f"  {col_name:<30} {data_type}{max_len:<15} {nullable}{default}")
-        
-        # Get row counts
-        print("\n" + "="*70)
-        print("Row Counts:")
-        print("="*70 + "\n")
-        
-        for row in tables:
-            schema = row[0]
-            table = row[1]
-            cursor.execute(f'SELECT COUNT(*) FROM "{schema}"."{table}"')
-            count = cursor.fetchone()[0]
-            print(f"  {schema}.{table:<40} {count:>10} rows")
+            print("\n" + "="*70)
+            print(f"DATABASE: {env_config['database']}")
+            print(f"HOST: {env_config.get('host', 'N/A')}")
+            print("="*70)
+            print(f"\nTotal Tables Found: {len(tables)}\n")
+            
+            sys.stdout.write(''.join(f"  {row[0]}.{row[1]:<40} ({row[2]} columns)\n" for row in tables))
+            
+            if show_columns:
+                print("\n" + "="*70)
+                print("Getting detailed column information for each table...")
+                print("="*70 + "\n")
+                
+                # Get columns for all tables in one query from pg_attribute, streamed from
+                # a server-side cursor so large schemas are never fully buffered client-side.
+                # It runs once per invocation, so a PREPARE'd statement would save nothing.
+                # data_type, length, nullability and default follow information_schema.columns.
+                # Generated columns (PostgreSQL 12+) have no column_default
+                if conn.server_version >= 120000:
+                    column_default = sql.SQL("CASE WHEN a.attgenerated = '' THEN pg_get_expr(ad.adbin, ad.adrelid) END")
+                else:
+                    column_default = sql.SQL("pg_get_expr(ad.adbin, ad.adrelid)")
+                column_cursor = conn.cursor(name='table_columns')
+                column_cursor.itersize = 2000
+                column_cursor.execute(sql.SQL("""
+                    SELECT 
+                        n.nspname,
+                        c.relname,
+                        a.attname,
+                        CASE WHEN t.typtype = 'd' THEN
+                                CASE WHEN bt.typelem <> 0 AND bt.typlen = -1 THEN 'ARRAY'
+                                     WHEN nbt.nspname = 'pg_catalog' THEN format_type(t.typbasetype, NULL)
+                                     ELSE 'USER-DEFINED' END
+                             ELSE
+                                CASE WHEN t.typelem <> 0 AND t.typlen = -1 THEN 'ARRAY'
+                                     WHEN nt.nspname = 'pg_catalog' THEN format_type(a.atttypid, NULL)
+                                     ELSE 'USER-DEFINED' END
+                        END,
+                        information_schema._pg_char_max_length(information_schema._pg_truetypid(a.*, t.*),
+                                                               information_schema._pg_truetypmod(a.*, t.*)),
+                        NOT (a.attnotnull OR (t.typtype = 'd' AND t.typnotnull)),
+                        {column_default}
+                    FROM pg_attribute a
+                    JOIN pg_class c ON c.oid = a.attrelid
+                    JOIN pg_namespace n ON n.oid = c.relnamespace
+                    JOIN pg_type t ON t.oid = a.atttypid
+                    JOIN pg_namespace nt ON nt.oid = t.typnamespace
+                    LEFT JOIN pg_type bt ON t.typtype = 'd' AND bt.oid = t.typbasetype
+                    LEFT JOIN pg_namespace nbt ON nbt.oid = bt.typnamespace
+                    LEFT JOIN pg_attrdef ad ON ad.adrelid = a.attrelid AND ad.adnum = a.attnum
+                    WHERE a.attrelid = ANY(%s::oid[]) 
+                      AND a.attnum > 0 
+                      AND NOT a.attisdropped
+                      AND (pg_has_role(c.relowner, 'USAGE')
+                           OR has_column_privilege(c.oid, a.attnum, 'SELECT, INSERT, UPDATE, REFERENCES'))
+                    ORDER BY n.nspname, c.relname, a.attnum
+                """).format(column_default=column_default), ([row[3] for row in tables],))
+                
+                # Collect each table's block and write it in one call instead of a print per column
+                for (schema, table), columns in groupby(column_cursor, key=itemgetter(0, 1)):
+                    out = [f"\n{schema}.{table}\n", "-" * 70 + "\n"]
+                    for col in columns:
+                        col_name = col[2]
+                        data_type = col[3]
+                        max_len = f"({col[4]})" if col[4] else ""
+                        nullable = "NULL" if col[5] else "NOT NULL"
+                        default = f" DEFAULT {col[6]}" if col[6] else ""
+                        out.append(f"  {col_name:<30} {data_type}{max_len:<15} {nullable}{default}\n")
+                    sys.stdout.write(''.join(out))
+                column_cursor.close()
+            
+            if show_counts:
+                # Get row counts
+                print("\n" + "="*70)
+                if exact:
+                    print("Row Counts (exact):")
+                    # Each COUNT(*) runs on its own backend; map() keeps the table order
+                    db_params = get_db_params(env_config)
+                    with ThreadPoolExecutor(max_workers=COUNT_WORKERS) as executor:
+                        counts = list(executor.map(lambda row: count_rows(db_params, row[0], row[1]), tables))
+                else:
+                    # Planner estimates from the last VACUUM/ANALYZE, fetched with the table list
+                    print("Row Counts (estimated, use --exact for COUNT(*)):")
+                    counts = [(row[0], row[1], row[4]) for row in tables]
+                print("="*70 + "\n")
+                
+                out = []
+                for schema, table, count in counts:
+                    if count < 0:
+                        out.append(f"  {schema}.{table:<40} {'never analyzed':>10}\n")
+                    else:
+                        out.append(f"  {schema}.{table:<40} {count:>10} rows\n")
+                sys.stdout.write(''.join(out))
         
-        conn.close()
         print("\n" + "="*70)
         print("Query completed successfully")
         print("="*70)
@@ -124,6 +195,18 @@ if __name__ == "__main__":
                         help='Environment to use (default: target)')
     parser.add_argument('--config', type=str, default='../db_config.json',
                         help='Path to config file (default: ../db_config.json)')
+    parser.add_argument('--exact', action='store_true',
+                        help='Use COUNT(*) for row counts instead of catalog estimates')
+    parser.add_argument('--schema', type=str,
+                        help='Only include tables in this schema')
+    parser.add_argument('--table', type=str,
+                        help='Only include tables whose name matches this LIKE pattern (e.g. "pet%%")')
+    parser.add_argument('--no-columns', action='store_true',
+                        help='Skip the per-table column details')
+    parser.add_argument('--no-counts', action='store_true',
+                        help='Skip the row counts')
     
     args = parser.parse_args()
-    query_tables(args.env, args.config)
+    query_tables(args.env, args.config, exact=args.exact,
+                 schema=args.schema, table_pattern=args.table,
+                 show_columns=not args.no_columns, show_counts=not args.no_counts)
@@ -0,0 +1,50 @@
+"""
+Shared PostgreSQL connection pool and config loading for the PetClinic test scripts
+"""
+import json
+import os
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+
+from psycopg2.pool import ThreadedConnectionPool
+
+@lru_cache(maxsize=8)
+def _read_config(resolved_path):
+    """Parse a config file once per process"""
+    with open(resolved_path, 'r') as f:
+        return json.load(f)
+
+def load_config(config_path="db_config.json", env_name="target"):
+    """Load an environment's database configuration from JSON file"""
+    # Resolve the path so relative and absolute spellings share one cache entry
+    config = _read_config(os.fspath(Path(config_path).resolve()))
+    # Hand out a copy so callers can't modify the cached config
+    return dict(config['environments'][env_name])
+
+# One pool per distinct set of connection parameters
+_pools = {}
+
+def get_pool(db_config, minconn=1, maxconn=10):
+    """Return the pool for these connection parameters, creating it on first use"""
+    key = tuple(sorted(db_config.items()))
+    if key not in _pools:
+        _pools[key] = ThreadedConnectionPool(minconn, maxconn, **db_config)
+    return _pools[key]
+
+@contextmanager
+def pooled_connection(db_config):
+    """Borrow a connection from the shared pool and hand it back afterwards"""
+    pool = get_pool(db_config)
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        # putconn rolls back any open transaction before the connection is reused
+        pool.putconn(conn)
+
+def close_all():
+    """Close every pooled connection"""
+    for pool in _pools.values():
+        pool.closeall()
+    _pools.clear()
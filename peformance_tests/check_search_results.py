@@ -1,26 +1,90 @@
+import argparse
+
 import requests
-import re
+from requests.adapters import HTTPAdapter
 
-# Test search results
-r = requests.get('http://10.134.77.66:8080/petclinic/owners.html', params={'lastName': 'Davis'})
-print(f'Search Status: {r.status_code}')
-print('\nAll owner links:')
-links = re.findall(r'href="([^"]*owners/\d+[^"]*)"', r.text)
-for link in links[:5]:
-    print(f'  {link}')
+try:
+    import re2 as re  # Linear-time RE2 engine when google-re2 is installed
+except ImportError:
+    import re
 
-print('\nTrying JMeter regex patterns:')
-# Current pattern in JMeter
-pattern1 = r'/owners/(\d+)\.html'
-matches1 = re.findall(pattern1, r.text)
-print(f'Pattern "/owners/(\\d+)\\.html": {matches1[:3] if matches1 else "NO MATCH"}')
+try:
+    from selectolax.parser import HTMLParser  # C HTML parser, pulls every <a href> in one pass
+except ImportError:
+    HTMLParser = None
 
+# Compile every pattern once (bytes patterns, so the body is never decoded)
+LINK_PATTERN = re.compile(rb'href="([^"]*owners/\d+[^"]*)"')
+# Current pattern in JMeter
+PATTERN1 = re.compile(rb'/owners/(\d+)\.html')
 # Try with context path
-pattern2 = r'/petclinic/owners/(\d+)\.html'
-matches2 = re.findall(pattern2, r.text)
-print(f'Pattern "/petclinic/owners/(\\d+)\\.html": {matches2[:3] if matches2 else "NO MATCH"}')
-
+PATTERN2 = re.compile(rb'/petclinic/owners/(\d+)\.html')
 # Try relative pattern
-pattern3 = r'owners/(\d+)\.html'
-matches3 = re.findall(pattern3, r.text)
-print(f'Pattern "owners/(\\d+)\\.html": {matches3[:3] if matches3 else "NO MATCH"}')
+PATTERN3 = re.compile(rb'owners/(\d+)\.html')
+# Owner detail links among the parsed hrefs (same filter as LINK_PATTERN)
+OWNER_HREF = re.compile(r'owners/\d+')
+
+def scan_response(response, patterns, chunk_size=8192):
+    """Run each pattern over the body as it streams in, cutting at line ends so no match is split"""
+    results = [[] for _ in patterns]
+    pending = b''
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        pending += chunk
+        cut = pending.rfind(b'\n') + 1
+        if cut:
+            for found, pattern in zip(results, patterns):
+                found.extend(pattern.findall(pending, 0, cut))
+            pending = pending[cut:]
+    for found, pattern in zip(results, patterns):
+        found.extend(pattern.findall(pending))
+    return [[match.decode() for match in found] for found in results]
+
+def find_owner_links(response):
+    """Return the owner links and each pattern's matches, parsing the HTML links with selectolax when available"""
+    if HTMLParser is None:
+        return scan_response(response, [LINK_PATTERN, PATTERN1, PATTERN2, PATTERN3])
+
+    body = response.content
+    tree = HTMLParser(body)
+    hrefs = [a.attributes.get('href') or '' for a in tree.css('a[href*="owners/"]')]
+    links = [href for href in hrefs if OWNER_HREF.search(href)]
+    # JMeter's extractor scans the whole body, so the patterns must too
+    return [links] + [[match.decode() for match in pattern.findall(body)]
+                      for pattern in (PATTERN1, PATTERN2, PATTERN3)]
+
+BASE_URL = 'http://10.134.77.66:8080/petclinic'
+
+def check(session, last_name, base_url=BASE_URL):
+    """Search owners by last name and show what each JMeter extractor pattern would match"""
+    with session.get(f'{base_url}/owners.html', params={'lastName': last_name}, stream=True) as r:
+        print(f'Search Status ({last_name}): {r.status_code}')
+        links, matches1, matches2, matches3 = find_owner_links(r)
+
+    print('\nAll owner links:')
+    for link in links[:5]:
+        print(f'  {link}')
+
+    print('\nTrying JMeter regex patterns:')
+    print(f'Pattern "/owners/(\\d+)\\.html": {matches1[:3] if matches1 else "NO MATCH"}')
+
+    print(f'Pattern "/petclinic/owners/(\\d+)\\.html": {matches2[:3] if matches2 else "NO MATCH"}')
+
+    print(f'Pattern "owners/(\\d+)\\.html": {matches3[:3] if matches3 else "NO MATCH"}')
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Check owner search results against the JMeter extractor patterns')
+    parser.add_argument('last_names', nargs='*', default=['Davis'],
+                        help='Last names to search for (default: Davis)')
+    parser.add_argument('--base-url', default=BASE_URL,
+                        help=f'Application base URL (default: {BASE_URL})')
+    args = parser.parse_args()
+
+    # One keep-alive session for every probe, so repeated searches skip the TCP handshake
+    with requests.Session() as session:
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        for i, last_name in enumerate(args.last_names):
+            if i:
+                print('\n' + '-' * 60)
+            check(session, last_name, args.base_url)
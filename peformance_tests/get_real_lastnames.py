@@ -1,39 +1,58 @@
-import psycopg2
-import json
+import io
+import psycopg2.errors
 import sys
 sys.path.append('..')
+from db_pool import load_config, pooled_connection
 
 # Load database config
-with open('../db_config.json') as f:
-    config = json.load(f)['environments']['target']
-    # Remove non-psycopg2 fields
-    db_config = {
-        'host': config['host'],
-        'port': config['port'],
-        'database': config['database'],
-        'user': config['username'],
-        'password': config['password']
-    }
+config = load_config('../db_config.json', 'target')
+# Remove non-psycopg2 fields
+db_config = {
+    'host': config['host'],
+    'port': config['port'],
+    'database': config['database'],
+    'user': config['username'],
+    'password': config['password']
+}
 
-# Connect and get last names
-conn = psycopg2.connect(**db_config)
-cur = conn.cursor()
+# Borrow a pooled connection and stream the last names out with COPY
+buf = io.StringIO()
+with pooled_connection(db_config) as conn:
+    cur = conn.cursor()
+    
+    # Make sure the GROUP BY can be fed from an index on last_name (the stock
+    # PetClinic schema ships one; only create ours when no such index exists)
+    cur.execute("""
+        SELECT 1 FROM pg_index i
+        JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = i.indkey[0]
+        WHERE i.indrelid = 'owners'::regclass AND a.attname = 'last_name'
+    """)
+    if cur.fetchone() is None:
+        try:
+            cur.execute('CREATE INDEX IF NOT EXISTS owners_lastname_idx ON owners (last_name)')
+            cur.execute('ANALYZE owners')
+            conn.commit()
+            print('Created index owners_lastname_idx on owners(last_name)')
+        except psycopg2.errors.InsufficientPrivilege:
+            conn.rollback()
+            print('No permission to create an index on owners(last_name); continuing without it')
+    
+    cur.copy_expert(
+        'COPY (SELECT last_name, COUNT(*) AS count FROM owners GROUP BY last_name '
+        'ORDER BY count DESC, last_name LIMIT 30) TO STDOUT WITH (FORMAT text)',
+        buf
+    )
+    
+    cur.close()
 
-cur.execute('SELECT DISTINCT last_name, COUNT(*) as count FROM owners GROUP BY last_name ORDER BY count DESC, last_name LIMIT 30')
-results = cur.fetchall()
+rows = [line.split('\t') for line in buf.getvalue().splitlines()]
 
 print('Last names in database with owner count:')
 print('-' * 40)
-for name, count in results:
-    print(f'{name:<20} {count:>3} owners')
+print('\n'.join(f'{name:<20} {count:>3} owners' for name, count in rows))
 
-cur.close()
-conn.close()
-
-# Write to CSV
+# Write to CSV in a single write
 print('\nWriting to common_last_names.csv...')
 with open('common_last_names.csv', 'w') as f:
-    f.write('searchLastName\n')
-    for name, _ in results:
-        f.write(f'{name}\n')
+    f.write('searchLastName\n' + ''.join(f'{name}\n' for name, _ in rows))
 print('Done!')
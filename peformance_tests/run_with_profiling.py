@@ -2,28 +2,51 @@
 """
 PetClinic Performance Test with System Profiling
 This script monitors CPU, Memory, Disk, and Network while running JMeter tests
-Usage: python run_with_profiling.py <test_file.jmx> [--env {source,target,local}] [--config <path>] [--reset-data]
+Usage: python run_with_profiling.py <test_file.jmx> [--env {source,target,local}] [--config <path>] [--reset-data] [--profile [--sample-interval SECONDS]]
 """
 
 import sys
 import os
 import subprocess
 import time
-import csv
-import signal
 import json
 import argparse
+import codecs
+import csv
+import queue
+import threading
+import shlex
+import shutil
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
 try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+try:
+    import numpy as np
     import pandas as pd
     import matplotlib.pyplot as plt
     import matplotlib.dates as mdates
+    from matplotlib.collections import LineCollection, PolyCollection
+    from matplotlib.lines import Line2D
     GRAPHING_AVAILABLE = True
 except ImportError:
     GRAPHING_AVAILABLE = False
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Color codes for console output
 class Colors:
     CYAN = '\033[96m'
@@ -33,12 +56,15 @@ class Colors:
     RESET = '\033[0m'
     BOLD = '\033[1m'
 
+def color_text(text, color=''):
+    """Wrap text in ANSI color codes (plain text on Windows)"""
+    if os.name == 'nt':  # Windows
+        return text
+    return f"{color}{text}{Colors.RESET}"
+
 def print_color(text, color=''):
     """Print colored text"""
-    if os.name == 'nt':  # Windows
-        print(text)
-    else:
-        print(f"{color}{text}{Colors.RESET}")
+    print(color_text(text, color))
 
 def print_header(text):
     """Print section header"""
@@ -63,6 +89,32 @@ def load_api_config(config_path="../api_config.json", env_name="target"):
         print_color(f"Error: Environment '{env_name}' not found in configuration", Colors.RED)
         return None
 
+@dataclass(frozen=True)
+class EnvConfig:
+    """Resolved API environment settings"""
+    host: str
+    port: int
+    protocol: str
+    context_path: str
+    base_url: str
+    description: str
+    
+    @classmethod
+    def from_dict(cls, env_config, env_name):
+        """Apply defaults once so callers use attributes instead of repeated .get() lookups"""
+        host = env_config.get('host', 'localhost')
+        port = env_config.get('port', 8080)
+        protocol = env_config.get('protocol', 'http')
+        context_path = env_config.get('context_path', '/petclinic')
+        return cls(
+            host=host,
+            port=port,
+            protocol=protocol,
+            context_path=context_path,
+            base_url=env_config.get('base_url', f"{protocol}://{host}:{port}{context_path}"),
+            description=env_config.get('description', env_name)
+        )
+
 def check_application_running(base_url="http://10.134.77.66:8080/petclinic"):
     """Check if the PetClinic application is running"""
     try:
@@ -76,7 +128,6 @@ def reset_database_snapshot(env_name="target", snapshot_file=None):
     """Reset and load PetClinic database snapshot using populate_test_data.py"""
     import subprocess
     import os
-    import glob
     
     print()
     print_color("Database Reset and Snapshot Load", Colors.CYAN)
@@ -92,10 +143,16 @@ def reset_database_snapshot(env_name="target", snapshot_file=None):
     if not snapshot_file:
         print("  [1/3] Auto-detecting latest snapshot file...")
         snapshot_pattern = os.path.join("..", "petclinic_snapshot_*.json")
-        snapshots = glob.glob(snapshot_pattern)
-        if not snapshots:
+        # One directory pass with a single stat per matching entry
+        best_ctime = None
+        with os.scandir("..") as entries:
+            for entry in entries:
+                if entry.name.startswith("petclinic_snapshot_") and entry.name.endswith(".json"):
+                    ctime = entry.stat().st_ctime
+                    if best_ctime is None or ctime > best_ctime:
+                        best_ctime, snapshot_file = ctime, entry.path
+        if not snapshot_file:
             raise Exception(f"No snapshot files found matching: {snapshot_pattern}")
-        snapshot_file = max(snapshots, key=os.path.getctime)
         print(f"  [OK] Using snapshot: {os.path.basename(snapshot_file)}")
     else:
         print(f"  [1/3] Using specified snapshot: {snapshot_file}")
@@ -116,136 +173,201 @@ def reset_database_snapshot(env_name="target", snapshot_file=None):
         "--additional", "0"
     ]
     
+    # Stream output as it arrives instead of buffering the whole run; the timer kills
+    # the child after 5 minutes even if it stops printing
+    timed_out = threading.Event()
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=300  # 5 minute timeout
+            bufsize=1
         )
+        timer = threading.Timer(300, lambda: (timed_out.set(), proc.kill()))
+        timer.start()
         
-        # Parse output for summary
-        output_lines = result.stdout.split('\n')
-        for line in output_lines:
-            if 'Total records' in line or 'Loaded' in line or 'Created' in line:
-                print(f"    {line}")
+        # Show summary lines live; keep a short tail for error reporting
+        tail = deque(maxlen=20)
+        try:
+            for line in proc.stdout:
+                line = line.rstrip()
+                tail.append(line)
+                if 'Total records' in line or 'Loaded' in line or 'Created' in line:
+                    print(f"    {line}")
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
         
-        if result.returncode != 0:
-            print(f"  [WARNING] populate_test_data.py exited with code {result.returncode}")
-            if result.stderr:
-                print(f"  Error: {result.stderr}")
-        else:
-            print(f"  [OK] Database snapshot loaded successfully")
+        if not timed_out.is_set():
+            if returncode != 0:
+                print(f"  [WARNING] populate_test_data.py exited with code {returncode}")
+                if tail:
+                    print("  Error: " + "\n".join(tail))
+            else:
+                print(f"  [OK] Database snapshot loaded successfully")
         
-    except subprocess.TimeoutExpired:
-        raise Exception("Database reset timed out after 5 minutes")
     except Exception as e:
         raise Exception(f"Failed to run populate_test_data.py: {e}")
     
+    if timed_out.is_set():
+        raise Exception("Database reset timed out after 5 minutes")
+    
     print()
     print_color("Database Reset Complete!", Colors.GREEN)
     print()
 
-def start_linux_monitoring(output_file):
-    """Start performance monitoring on Linux"""
-    monitoring_script = """#!/usr/bin/env python3
-import psutil
-import time
-import csv
-from datetime import datetime
+# Monitor CSV layout (mimicking Windows typeperf format); fixed schema, so rows are
+# formatted directly rather than through csv.writer
+MONITOR_HEADER = ('Timestamp,CPU_Total_Percent,Memory_Available_MB,Memory_Used_Percent,'
+                  'Disk_Reads_PerSec,Disk_Writes_PerSec,Network1_Bytes_PerSec,'
+                  'DotNet_CPU_Percent,DotNet_Memory_MB\n')
+MONITOR_ROW = '%s,%.1f,%.2f,%.1f,%.2f,%.2f,%.2f,%.1f,%d\n'
+# Rows are buffered and written in batches instead of one write+flush per sample
+FLUSH_EVERY = 10
 
-# Find dotnet process
-dotnet_proc = None
-for proc in psutil.process_iter(['pid', 'name']):
-    if proc.info['name'] == 'dotnet':
-        dotnet_proc = psutil.Process(proc.info['pid'])
-        break
+def _write_monitor_rows(output_file, rows):
+    """Drain formatted rows from the queue into the CSV until a None sentinel arrives"""
+    with open(output_file, 'w', newline='', buffering=1 << 20) as f:
+        f.write(MONITOR_HEADER)
+        batch = []
+        while True:
+            row = rows.get()
+            if row is None:
+                break
+            batch.append(row)
+            if len(batch) >= FLUSH_EVERY:
+                f.writelines(batch)
+                f.flush()
+                batch.clear()
+        f.writelines(batch)
 
-# Create CSV file
-with open('{}', 'w', newline='') as f:
-    writer = csv.writer(f)
-    # Write header (mimicking Windows typeperf format)
-    writer.writerow(['Timestamp', 'CPU_Total_Percent', 'Memory_Available_MB', 'Memory_Used_Percent', 
-                     'Disk_Reads_PerSec', 'Disk_Writes_PerSec', 'Network1_Bytes_PerSec', 
-                     'DotNet_CPU_Percent', 'DotNet_Memory_MB'])
+def _monitor_loop(output_file, stop_evt, interval=1.0):
+    """Sample system and dotnet metrics every interval seconds until stop_evt is set"""
+    # Reuse system-wide readings taken less than half a period ago instead of re-parsing
+    # /proc; regular samples always read fresh values, only faster bursts are served cached
+    min_dt = interval / 2
+    readings = {}
     
-    # Initialize counters
-    prev_disk_io = psutil.disk_io_counters()
-    prev_net_io = psutil.net_io_counters()
-    prev_time = time.time()
+    def cached(fn):
+        now = time.monotonic()
+        hit = readings.get(fn)
+        if hit is not None and now - hit[0] < min_dt:
+            return hit[1]
+        value = fn()
+        readings[fn] = (now, value)
+        return value
     
-    while True:
-        try:
-            timestamp = datetime.now().strftime('%m/%d/%Y %H:%M:%S.%f')[:-3]
-            
-            # CPU
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            
-            # Memory
-            mem = psutil.virtual_memory()
-            mem_available_mb = mem.available / (1024 * 1024)
-            mem_used_percent = mem.percent
-            
-            # Disk I/O
-            curr_disk_io = psutil.disk_io_counters()
-            curr_time = time.time()
-            time_delta = curr_time - prev_time
-            
-            disk_reads_per_sec = (curr_disk_io.read_count - prev_disk_io.read_count) / time_delta if time_delta > 0 else 0
-            disk_writes_per_sec = (curr_disk_io.write_count - prev_disk_io.write_count) / time_delta if time_delta > 0 else 0
-            
-            # Network
-            curr_net_io = psutil.net_io_counters()
-            net_bytes_per_sec = ((curr_net_io.bytes_sent + curr_net_io.bytes_recv) - 
-                                (prev_net_io.bytes_sent + prev_net_io.bytes_recv)) / time_delta if time_delta > 0 else 0
-            
-            # .NET Process
-            dotnet_cpu = 0
-            dotnet_mem = 0
-            if dotnet_proc and dotnet_proc.is_running():
-                try:
-                    dotnet_cpu = dotnet_proc.cpu_percent(interval=0.1)
-                    dotnet_mem = dotnet_proc.memory_info().rss
-                except:
-                    pass
-            
-            # Write row
-            writer.writerow([timestamp, cpu_percent, mem_available_mb, mem_used_percent,
-                           disk_reads_per_sec, disk_writes_per_sec, net_bytes_per_sec,
-                           dotnet_cpu, dotnet_mem])
-            f.flush()
-            
-            # Update previous values
-            prev_disk_io = curr_disk_io
-            prev_net_io = curr_net_io
-            prev_time = curr_time
-            
-            time.sleep(1)
-        except KeyboardInterrupt:
-            break
-        except Exception as e:
-            print(f"Monitoring error: {{e}}")
-            time.sleep(1)
-""".format(output_file)
+    # Sampling only formats rows and queues them; a writer thread owns the file,
+    # so a slow disk never delays the next sample
+    rows = queue.SimpleQueue()
+    writer = threading.Thread(target=_write_monitor_rows, args=(output_file, rows), daemon=True)
+    writer.start()
     
-    # Write monitoring script to temp file
-    script_path = f"results/profiling/monitor_{os.getpid()}.py"
-    with open(script_path, 'w') as f:
-        f.write(monitoring_script)
+    # Find dotnet process
+    dotnet_proc = None
+    for proc in psutil.process_iter(['pid', 'name']):
+        if proc.info['name'] == 'dotnet':
+            dotnet_proc = proc
+            dotnet_proc.cpu_percent(interval=None)  # Seed the reference so the first sample is non-zero
+            break
     
-    # Make it executable and start it
-    os.chmod(script_path, 0o755)
+    # Initialize counters
+    prev_disk_io = cached(psutil.disk_io_counters)
+    prev_net_io = cached(psutil.net_io_counters)
+    prev_time = time.monotonic()
+    psutil.cpu_percent(interval=None)  # Seed the reference so the first sample is meaningful
+    next_tick = prev_time
     
     try:
-        process = subprocess.Popen(
-            ['python3', script_path],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
-        return process
-    except Exception as e:
-        print(f"Error starting monitoring: {e}")
-        return None
+        while not stop_evt.is_set():
+            try:
+                timestamp = datetime.now().strftime('%m/%d/%Y %H:%M:%S.%f')[:-3]
+                
+                # CPU
+                cpu_percent = psutil.cpu_percent(interval=None)
+                
+                # Memory
+                mem = cached(psutil.virtual_memory)
+                mem_available_mb = mem.available / (1024 * 1024)
+                mem_used_percent = mem.percent
+                
+                # Disk I/O
+                curr_disk_io = cached(psutil.disk_io_counters)
+                curr_time = time.monotonic()
+                time_delta = curr_time - prev_time
+                
+                disk_reads_per_sec = (curr_disk_io.read_count - prev_disk_io.read_count) / time_delta if time_delta > 0 else 0
+                disk_writes_per_sec = (curr_disk_io.write_count - prev_disk_io.write_count) / time_delta if time_delta > 0 else 0
+                
+                # Network
+                curr_net_io = cached(psutil.net_io_counters)
+                net_bytes_per_sec = ((curr_net_io.bytes_sent + curr_net_io.bytes_recv) - 
+                                    (prev_net_io.bytes_sent + prev_net_io.bytes_recv)) / time_delta if time_delta > 0 else 0
+                
+                # .NET Process
+                dotnet_cpu = 0
+                dotnet_mem = 0
+                if dotnet_proc is not None:
+                    try:
+                        # oneshot() reads /proc/<pid> once for all three calls
+                        with dotnet_proc.oneshot():
+                            if dotnet_proc.is_running():
+                                dotnet_cpu = dotnet_proc.cpu_percent(interval=None)
+                                dotnet_mem = dotnet_proc.memory_info().rss
+                    except psutil.NoSuchProcess:
+                        dotnet_proc = None
+                    except psutil.AccessDenied:
+                        pass
+                
+                # Queue row
+                rows.put(MONITOR_ROW % (timestamp, cpu_percent, mem_available_mb, mem_used_percent,
+                                        disk_reads_per_sec, disk_writes_per_sec, net_bytes_per_sec,
+                                        dotnet_cpu, dotnet_mem))
+                
+                # Update previous values
+                prev_disk_io = curr_disk_io
+                prev_net_io = curr_net_io
+                prev_time = curr_time
+            except Exception as e:
+                print(f"Monitoring error: {e}")
+            
+            # Wait for an absolute monotonic deadline so the period does not drift;
+            # the event wakes us immediately when monitoring is stopped
+            next_tick += interval
+            stop_evt.wait(max(0.0, next_tick - time.monotonic()))
+    finally:
+        rows.put(None)
+        writer.join()
+
+def start_linux_monitoring(output_file, interval=1.0):
+    """Start performance monitoring on Linux in a background thread"""
+    if not PSUTIL_AVAILABLE:
+        print("Error starting monitoring: psutil not installed. Install with: pip install psutil")
+        return None, None
+    
+    stop_evt = threading.Event()
+    monitor_thread = threading.Thread(
+        target=_monitor_loop,
+        args=(output_file, stop_evt, interval),
+        name='perf-monitor',
+        daemon=True
+    )
+    monitor_thread.start()
+    return monitor_thread, stop_evt
+
+def add_series(ax, x, series, colors, labels, alpha=0.8, fill_alpha=None):
+    """Draw several series as one LineCollection (and their fills as one PolyCollection); returns legend handles"""
+    ax.xaxis_date()
+    ax.add_collection(LineCollection([np.column_stack([x, y]) for y in series],
+                                     colors=colors, linewidths=2, alpha=alpha))
+    if fill_alpha is not None:
+        baseline = [[x[-1], 0], [x[0], 0]]
+        ax.add_collection(PolyCollection([np.vstack([np.column_stack([x, y]), baseline]) for y in series],
+                                         facecolors=colors, linewidths=0, alpha=fill_alpha, rasterized=True))
+    ax.autoscale_view()
+    return [Line2D([], [], color=color, linewidth=2, alpha=alpha, label=label)
+            for color, label in zip(colors, labels)]
 
 def generate_performance_graphs(clean_file, output_dir='results/profiling/graphs'):
     """Generate performance graphs from clean CSV file"""
@@ -263,61 +385,81 @@ def generate_performance_graphs(clean_file, output_dir='results/profiling/graphs
         
         # Load data
         print(f"  Loading data from: {clean_file}")
-        df = pd.read_csv(clean_file)
+        header = pd.read_csv(clean_file, nrows=0).columns
+        network_cols = [col for col in header if col.startswith('Network') and col.endswith('_Bytes_PerSec')]
+        numeric_cols = [col for col in ('CPU_Total_Percent', 'Memory_Available_MB', 'Memory_Used_Percent',
+                                        'Disk_Reads_PerSec', 'Disk_Writes_PerSec', 'DotNet_CPU_Percent',
+                                        'DotNet_Memory_MB') if col in header] + network_cols
         
-        # Convert timestamp to datetime
-        df['Timestamp'] = pd.to_datetime(df['Timestamp'])
+        # Parse timestamps and float32 counters in a single pass
+        df = pd.read_csv(
+            clean_file,
+            parse_dates=['Timestamp'],
+            date_format='%m/%d/%Y %H:%M:%S.%f',
+            dtype=dict.fromkeys(numeric_cols, 'float32'),
+            na_values=[' ']
+        )
+        df[numeric_cols] = df[numeric_cols].fillna(0.0)
         
         # Calculate elapsed time
-        df['Elapsed_Seconds'] = (df['Timestamp'] - df['Timestamp'].min()).dt.total_seconds()
+        timestamps = df['Timestamp'].to_numpy()
+        df['Elapsed_Seconds'] = (timestamps - timestamps.min()) / np.timedelta64(1, 's')
         
         # Sum all network interface columns
-        network_cols = [col for col in df.columns if col.startswith('Network') and col.endswith('_Bytes_PerSec')]
         if network_cols:
+            # Accumulate into one float32 array instead of building a wide intermediate frame
+            network_total = np.zeros(len(df), dtype=np.float32)
             for col in network_cols:
-                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-            df['Network_Bytes_PerSec'] = df[network_cols].sum(axis=1)
+                np.add(network_total, df[col].to_numpy(dtype=np.float32, copy=False), out=network_total)
+            df['Network_Bytes_PerSec'] = network_total
         else:
             df['Network_Bytes_PerSec'] = 0
         
-        # Convert other numeric columns
-        numeric_cols = ['CPU_Total_Percent', 'Memory_Available_MB', 'Memory_Used_Percent', 
-                       'Disk_Reads_PerSec', 'Disk_Writes_PerSec', 'DotNet_CPU_Percent', 'DotNet_Memory_MB']
-        for col in numeric_cols:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-        
         print(f"  [OK] Loaded {len(df)} data points ({df['Elapsed_Seconds'].max():.1f} seconds)")
         
         # Create graphs
         plt.style.use('seaborn-v0_8-darkgrid')
         dotnet_mem_mb = df['DotNet_Memory_MB'] / (1024 * 1024)
         
-        fig, (ax1, ax2, ax3, ax4) = plt.subplots(4, 1, figsize=(16, 20))
+        # Compute every mean/peak once; the plots and the summary file both read from here
+        stat_cols = ['CPU_Total_Percent', 'DotNet_CPU_Percent', 'Memory_Used_Percent',
+                     'Disk_Reads_PerSec', 'Disk_Writes_PerSec', 'Network_Bytes_PerSec']
+        stats = df[stat_cols].agg(['mean', 'max']).to_dict()
+        dotnet_stats = {'mean': float(dotnet_mem_mb.mean()), 'max': float(dotnet_mem_mb.max())}
+        
+        # Statistics use every sample; plotted series are capped at ~4000 points,
+        # which is already more than the figure has horizontal pixels
+        stride = max(1, len(df) // 4000)
+        plot_df = df.iloc[::stride]
+        plot_mem_mb = dotnet_mem_mb.iloc[::stride]
+        
+        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12), constrained_layout=True)
+        
+        # Multi-series axes are drawn as one collection each instead of a Line2D per series
+        plot_x = mdates.date2num(plot_df['Timestamp'])
         
         # Graph 1: CPU Usage
-        ax1.plot(df['Timestamp'], df['CPU_Total_Percent'], color='#e74c3c', linewidth=2, label='Total CPU', alpha=0.8)
-        ax1.plot(df['Timestamp'], df['DotNet_CPU_Percent'], color='#3498db', linewidth=2, label='.NET Process CPU', alpha=0.8)
-        ax1.fill_between(df['Timestamp'], df['CPU_Total_Percent'], alpha=0.2, color='#e74c3c')
-        ax1.fill_between(df['Timestamp'], df['DotNet_CPU_Percent'], alpha=0.2, color='#3498db')
-        ax1.axhline(y=df['CPU_Total_Percent'].mean(), color='#e74c3c', linestyle='--', alpha=0.5, linewidth=1)
-        ax1.axhline(y=df['DotNet_CPU_Percent'].mean(), color='#3498db', linestyle='--', alpha=0.5, linewidth=1)
+        cpu_handles = add_series(ax1, plot_x,
+                                 [plot_df['CPU_Total_Percent'].to_numpy(), plot_df['DotNet_CPU_Percent'].to_numpy()],
+                                 ['#e74c3c', '#3498db'], ['Total CPU', '.NET Process CPU'], fill_alpha=0.2)
+        ax1.axhline(y=stats['CPU_Total_Percent']['mean'], color='#e74c3c', linestyle='--', alpha=0.5, linewidth=1)
+        ax1.axhline(y=stats['DotNet_CPU_Percent']['mean'], color='#3498db', linestyle='--', alpha=0.5, linewidth=1)
         ax1.set_ylabel('CPU Usage (%)', fontsize=12)
         ax1.set_xlabel('Time', fontsize=12)
         ax1.set_title('CPU Usage Over Time', fontsize=14, fontweight='bold', pad=15)
-        ax1.legend(loc='upper right', fontsize=10)
+        ax1.legend(handles=cpu_handles, loc='upper right', fontsize=10)
         ax1.grid(True, alpha=0.3)
         ax1.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
         ax1.tick_params(axis='x', rotation=45)
-        ax1.set_ylim(0, max(100, df['CPU_Total_Percent'].max() * 1.1))
-        ax1.text(0.02, 0.95, f'Avg Total: {df["CPU_Total_Percent"].mean():.1f}%\\nAvg .NET: {df["DotNet_CPU_Percent"].mean():.1f}%', 
+        ax1.set_ylim(0, max(100, stats['CPU_Total_Percent']['max'] * 1.1))
+        ax1.text(0.02, 0.95, f'Avg Total: {stats["CPU_Total_Percent"]["mean"]:.1f}%\nAvg .NET: {stats["DotNet_CPU_Percent"]["mean"]:.1f}%', 
                  transform=ax1.transAxes, fontsize=10, verticalalignment='top',
                  bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
         
         # Graph 2: Memory Usage
-        ax2.plot(df['Timestamp'], df['Memory_Used_Percent'], color='#2ecc71', linewidth=2, label='System Memory Used %')
-        ax2.fill_between(df['Timestamp'], df['Memory_Used_Percent'], alpha=0.3, color='#2ecc71')
-        ax2.axhline(y=df['Memory_Used_Percent'].mean(), color='#2ecc71', linestyle='--', alpha=0.5, linewidth=1)
+        ax2.plot(plot_df['Timestamp'], plot_df['Memory_Used_Percent'], color='#2ecc71', linewidth=2, label='System Memory Used %')
+        ax2.fill_between(plot_df['Timestamp'], plot_df['Memory_Used_Percent'], alpha=0.3, color='#2ecc71', rasterized=True)
+        ax2.axhline(y=stats['Memory_Used_Percent']['mean'], color='#2ecc71', linestyle='--', alpha=0.5, linewidth=1)
         ax2.set_ylabel('Memory Usage (%)', fontsize=12)
         ax2.set_xlabel('Time', fontsize=12)
         ax2.set_title('System Memory Usage Over Time', fontsize=14, fontweight='bold', pad=15)
@@ -326,14 +468,14 @@ def generate_performance_graphs(clean_file, output_dir='results/profiling/graphs
         ax2.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
         ax2.tick_params(axis='x', rotation=45)
         ax2.set_ylim(0, 100)
-        ax2.text(0.02, 0.95, f'Average: {df["Memory_Used_Percent"].mean():.1f}%', 
+        ax2.text(0.02, 0.95, f'Average: {stats["Memory_Used_Percent"]["mean"]:.1f}%', 
                  transform=ax2.transAxes, fontsize=10, verticalalignment='top',
                  bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
         
         # Graph 3: .NET Process Memory
-        ax3.plot(df['Timestamp'], dotnet_mem_mb, color='#f39c12', linewidth=2, label='.NET Process Memory')
-        ax3.fill_between(df['Timestamp'], dotnet_mem_mb, alpha=0.3, color='#f39c12')
-        ax3.axhline(y=dotnet_mem_mb.mean(), color='#f39c12', linestyle='--', alpha=0.5, linewidth=1)
+        ax3.plot(plot_df['Timestamp'], plot_mem_mb, color='#f39c12', linewidth=2, label='.NET Process Memory')
+        ax3.fill_between(plot_df['Timestamp'], plot_mem_mb, alpha=0.3, color='#f39c12', rasterized=True)
+        ax3.axhline(y=dotnet_stats['mean'], color='#f39c12', linestyle='--', alpha=0.5, linewidth=1)
         ax3.set_ylabel('Memory (MB)', fontsize=12)
         ax3.set_xlabel('Time', fontsize=12)
         ax3.set_title('.NET Process Memory Usage Over Time', fontsize=14, fontweight='bold', pad=15)
@@ -341,67 +483,70 @@ def generate_performance_graphs(clean_file, output_dir='results/profiling/graphs
         ax3.grid(True, alpha=0.3)
         ax3.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
         ax3.tick_params(axis='x', rotation=45)
-        ax3.text(0.02, 0.95, f'Average: {dotnet_mem_mb.mean():.1f} MB', 
+        ax3.text(0.02, 0.95, f'Average: {dotnet_stats["mean"]:.1f} MB', 
                  transform=ax3.transAxes, fontsize=10, verticalalignment='top',
                  bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
         
         # Graph 4: Disk I/O and Network
         ax4_twin = ax4.twinx()
-        line1 = ax4.plot(df['Timestamp'], df['Disk_Reads_PerSec'], color='#1abc9c', linewidth=2, label='Disk Reads/sec', alpha=0.8)
-        line2 = ax4.plot(df['Timestamp'], df['Disk_Writes_PerSec'], color='#e67e22', linewidth=2, label='Disk Writes/sec', alpha=0.8)
-        line3 = ax4_twin.plot(df['Timestamp'], df['Network_Bytes_PerSec'] / 1024, color='#9b59b6', linewidth=2, label='Network (KB/sec)', alpha=0.6, linestyle='--')
+        disk_handles = add_series(ax4, plot_x,
+                                  [plot_df['Disk_Reads_PerSec'].to_numpy(), plot_df['Disk_Writes_PerSec'].to_numpy()],
+                                  ['#1abc9c', '#e67e22'], ['Disk Reads/sec', 'Disk Writes/sec'])
+        line3 = ax4_twin.plot(plot_df['Timestamp'], plot_df['Network_Bytes_PerSec'] / 1024, color='#9b59b6', linewidth=2, label='Network (KB/sec)', alpha=0.6, linestyle='--')
         ax4.set_xlabel('Time', fontsize=12)
         ax4.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
         ax4.tick_params(axis='x', rotation=45)
         ax4.set_ylabel('Disk Operations per Second', fontsize=12, color='#1abc9c')
         ax4_twin.set_ylabel('Network KB/sec', fontsize=12, color='#9b59b6')
         ax4.set_title('Disk I/O and Network Over Time', fontsize=14, fontweight='bold', pad=15)
-        lines = line1 + line2 + line3
-        labels = [l.get_label() for l in lines]
-        ax4.legend(lines, labels, loc='upper right', fontsize=10)
+        ax4.legend(handles=disk_handles + line3, loc='upper right', fontsize=10)
         ax4.grid(True, alpha=0.3)
         ax4.tick_params(axis='y', labelcolor='#1abc9c')
         ax4_twin.tick_params(axis='y', labelcolor='#9b59b6')
         
-        plt.tight_layout()
-        
-        # Save graph
+        # Save graph straight from the Agg canvas: one render at the figure's own dpi,
+        # no savefig() dpi swap and no bbox_inches='tight' pass (constrained_layout fits it)
         output_file = os.path.join(output_dir, 'performance_report.png')
-        plt.savefig(output_file, dpi=150, bbox_inches='tight')
-        plt.close()
+        fig.set_dpi(110)
+        fig.canvas.print_png(output_file)
+        plt.close(fig)
         print(f"  [OK] Saved graph: {output_file}")
         
         # Create summary text file
         summary_file = os.path.join(output_dir, 'performance_summary.txt')
+        # Build the whole report first and write it with a single call
+        summary_lines = [
+            "PERFORMANCE SUMMARY\n",
+            "=" * 60 + "\n\n",
+            f"Test Duration: {df['Elapsed_Seconds'].max():.1f} seconds\n",
+            f"Start Time: {df['Timestamp'].min()}\n",
+            f"End Time: {df['Timestamp'].max()}\n",
+            f"Data Points: {len(df)}\n\n",
+            "CPU USAGE\n",
+            "-" * 60 + "\n",
+            f"Total CPU Average:    {stats['CPU_Total_Percent']['mean']:.2f}%\n",
+            f"Total CPU Peak:       {stats['CPU_Total_Percent']['max']:.2f}%\n",
+            f".NET CPU Average:     {stats['DotNet_CPU_Percent']['mean']:.2f}%\n",
+            f".NET CPU Peak:        {stats['DotNet_CPU_Percent']['max']:.2f}%\n\n",
+            "MEMORY USAGE\n",
+            "-" * 60 + "\n",
+            f"System Memory Avg:    {stats['Memory_Used_Percent']['mean']:.2f}%\n",
+            f"System Memory Peak:   {stats['Memory_Used_Percent']['max']:.2f}%\n",
+            f".NET Memory Avg:      {dotnet_stats['mean']:.2f} MB\n",
+            f".NET Memory Peak:     {dotnet_stats['max']:.2f} MB\n\n",
+            "DISK I/O\n",
+            "-" * 60 + "\n",
+            f"Disk Reads Average:   {stats['Disk_Reads_PerSec']['mean']:.2f} /sec\n",
+            f"Disk Reads Peak:      {stats['Disk_Reads_PerSec']['max']:.2f} /sec\n",
+            f"Disk Writes Average:  {stats['Disk_Writes_PerSec']['mean']:.2f} /sec\n",
+            f"Disk Writes Peak:     {stats['Disk_Writes_PerSec']['max']:.2f} /sec\n\n",
+            "NETWORK\n",
+            "-" * 60 + "\n",
+            f"Network Average:      {stats['Network_Bytes_PerSec']['mean']:.2f} bytes/sec\n",
+            f"Network Peak:         {stats['Network_Bytes_PerSec']['max']:.2f} bytes/sec\n\n",
+        ]
         with open(summary_file, 'w') as f:
-            f.write("PERFORMANCE SUMMARY\\n")
-            f.write("=" * 60 + "\\n\\n")
-            f.write(f"Test Duration: {df['Elapsed_Seconds'].max():.1f} seconds\\n")
-            f.write(f"Start Time: {df['Timestamp'].min()}\\n")
-            f.write(f"End Time: {df['Timestamp'].max()}\\n")
-            f.write(f"Data Points: {len(df)}\\n\\n")
-            f.write("CPU USAGE\\n")
-            f.write("-" * 60 + "\\n")
-            f.write(f"Total CPU Average:    {df['CPU_Total_Percent'].mean():.2f}%\\n")
-            f.write(f"Total CPU Peak:       {df['CPU_Total_Percent'].max():.2f}%\\n")
-            f.write(f".NET CPU Average:     {df['DotNet_CPU_Percent'].mean():.2f}%\\n")
-            f.write(f".NET CPU Peak:        {df['DotNet_CPU_Percent'].max():.2f}%\\n\\n")
-            f.write("MEMORY USAGE\\n")
-            f.write("-" * 60 + "\\n")
-            f.write(f"System Memory Avg:    {df['Memory_Used_Percent'].mean():.2f}%\\n")
-            f.write(f"System Memory Peak:   {df['Memory_Used_Percent'].max():.2f}%\\n")
-            f.write(f".NET Memory Avg:      {dotnet_mem_mb.mean():.2f} MB\\n")
-            f.write(f".NET Memory Peak:     {dotnet_mem_mb.max():.2f} MB\\n\\n")
-            f.write("DISK I/O\\n")
-            f.write("-" * 60 + "\\n")
-            f.write(f"Disk Reads Average:   {df['Disk_Reads_PerSec'].mean():.2f} /sec\\n")
-            f.write(f"Disk Reads Peak:      {df['Disk_Reads_PerSec'].max():.2f} /sec\\n")
-            f.write(f"Disk Writes Average:  {df['Disk_Writes_PerSec'].mean():.2f} /sec\\n")
-            f.write(f"Disk Writes Peak:     {df['Disk_Writes_PerSec'].max():.2f} /sec\\n\\n")
-            f.write("NETWORK\\n")
-            f.write("-" * 60 + "\\n")
-            f.write(f"Network Average:      {df['Network_Bytes_PerSec'].mean():.2f} bytes/sec\\n")
-            f.write(f"Network Peak:         {df['Network_Bytes_PerSec'].max():.2f} bytes/sec\\n\\n")
+            f.writelines(summary_lines)
         print(f"  [OK] Saved summary: {summary_file}")
         
         return True
@@ -431,6 +576,14 @@ def main():
   
   # Use custom config file and snapshot
   python run_with_profiling.py 01_New_Client_Registration.jmx --env target --config ../custom_api_config.json --snapshot ../my_snapshot.json --reset-data
+  
+  # Profile a short test at 1 second resolution
+  python run_with_profiling.py 05_High_Volume_Search.jmx --profile --sample-interval 1
+
+Sampling interval:
+  --sample-interval trades graph resolution for monitoring overhead. 1s is fine for
+  tests under ~10 minutes; 5-10s (default 5s) keeps the monitor's own CPU use low on
+  long runs.
         """
     )
     
@@ -458,6 +611,14 @@ def main():
         help='Enable system profiling (CPU, Memory, Disk, Network monitoring)'
     )
     
+    parser.add_argument(
+        '--sample-interval',
+        type=float,
+        default=5.0,
+        metavar='SECONDS',
+        help='Seconds between profiling samples (default: 5)'
+    )
+    
     parser.add_argument(
         '--reset-data',
         action='store_true',
@@ -471,6 +632,8 @@ def main():
     )
     
     args = parser.parse_args()
+    if args.sample_interval <= 0:
+        parser.error("--sample-interval must be greater than 0")
     
     test_file = args.test_file
     test_name = Path(test_file).stem
@@ -492,13 +655,13 @@ def main():
         print_color("\nFailed to load configuration. Exiting.", Colors.RED)
         sys.exit(1)
     
-    base_url = env_config['base_url']
+    cfg = EnvConfig.from_dict(env_config, args.env)
     
     print_header("Performance Test with System Profiling")
     print(f"Test File: {test_file}")
     print(f"Test Name: {test_name}")
-    print(f"Environment: {env_config.get('description', args.env)}")
-    print(f"Base URL: {base_url}")
+    print(f"Environment: {cfg.description}")
+    print(f"Base URL: {cfg.base_url}")
     print(f"Profiling: {'Enabled' if args.profile else 'Disabled'}")
     print(f"Reset Data: {'Yes' if args.reset_data else 'No'}")
     print(f"Timestamp: {timestamp}")
@@ -519,10 +682,8 @@ def main():
         print_color("[0/7] Skipping database reset (use --reset-data to enable)", Colors.YELLOW)
         print()
     
-    # Create directories
-    os.makedirs("results", exist_ok=True)
-    os.makedirs("results/profiling", exist_ok=True)
-    os.makedirs("results/profiling/graphs", exist_ok=True)
+    # Create directories (parents=True covers results/ and results/profiling/)
+    Path("results/profiling/graphs").mkdir(parents=True, exist_ok=True)
     
     # Clean up old results
     print_color("[1/7] Cleaning up old results...", Colors.YELLOW)
@@ -531,22 +692,28 @@ def main():
         f"results/{test_name}_jmeter.log"
     ]
     for file in cleanup_files:
-        if os.path.exists(file):
-            os.remove(file)
+        # unlink() and handle the miss instead of an exists() check first
+        try:
+            Path(file).unlink()
             print(f"  Deleted: {file}")
+        except FileNotFoundError:
+            pass
     
     # Remove old report directory
-    import shutil
     report_dir = f"results/{test_name}_report"
-    if os.path.exists(report_dir):
+    try:
         shutil.rmtree(report_dir)
         print(f"  Deleted directory: {report_dir}")
+    except FileNotFoundError:
+        pass
     
     print_color("[OK] Cleanup complete", Colors.GREEN)
     print()
     
     # Start Performance Monitoring
     perf_process = None
+    monitor_thread = None
+    monitor_stop = None
     perf_file = None
     clean_file = None
     
@@ -566,7 +733,7 @@ def main():
                 r'\Network Interface(*)\Bytes Total/sec',
                 r'\Process(dotnet)\% Processor Time',
                 r'\Process(dotnet)\Working Set - Private',
-                '-si', '1',
+                '-si', str(max(1, round(args.sample_interval))),  # typeperf takes whole seconds
                 '-o', perf_file
             ]
             
@@ -579,15 +746,15 @@ def main():
             
             print_color(f"[OK] Performance monitoring started (PID: {perf_process.pid})", Colors.GREEN)
         else:
-            # For Linux/Mac - Start custom monitoring script
-            perf_process = start_linux_monitoring(perf_file)
-            if perf_process:
-                print_color(f"[OK] Performance monitoring started (PID: {perf_process.pid})", Colors.GREEN)
+            # For Linux/Mac - Sample with psutil in a background thread
+            monitor_thread, monitor_stop = start_linux_monitoring(perf_file, args.sample_interval)
+            if monitor_thread:
+                print_color(f"[OK] Performance monitoring started (thread: {monitor_thread.name})", Colors.GREEN)
             else:
                 print_color("[WARNING] Performance monitoring could not be started", Colors.YELLOW)
         
         print(f"    Output file: {perf_file}")
-        print("    Collecting: CPU, Memory, Disk, Network metrics")
+        print(f"    Collecting: CPU, Memory, Disk, Network metrics every {args.sample_interval:g}s")
         print()
         
         # Wait for monitoring to stabilize
@@ -600,36 +767,38 @@ def main():
     print_color("[3/7] Running JMeter performance test...", Colors.YELLOW)
     print(f"    Test File: {test_file}")
     
-    # Extract API config parameters
-    host = env_config.get('host', 'localhost')
-    port = env_config.get('port', 8080)
-    protocol = env_config.get('protocol', 'http')
-    context_path = env_config.get('context_path', '/petclinic')
-    base_url = env_config.get('base_url', f"{protocol}://{host}:{port}{context_path}")
+    print(f"    Target: {cfg.protocol}://{cfg.host}:{cfg.port}{cfg.context_path}")
     
-    print(f"    Target: {protocol}://{host}:{port}{context_path}")
+    # Construct JMeter command with properties as an argument list (no shell parsing,
+    # so paths with spaces are passed through intact)
+    jmeter_cmd = [
+        'jmeter', '-n', '-t', test_file,
+        '-l', f'results/{test_name}_results.jtl',
+        '-j', f'results/{test_name}_jmeter.log',
+        '-e', '-o', f'results/{test_name}_report',
+        f'-JHOST={cfg.host}',
+        f'-JPORT={cfg.port}',
+        f'-JPROTOCOL={cfg.protocol}',
+        f'-JCONTEXT_PATH={cfg.context_path}',
+        f'-JBASE_URL={cfg.base_url}'
+    ]
+    print(f"    Command: {shlex.join(jmeter_cmd)}")
     print()
     
-    # Construct JMeter command with properties
-    jmeter_cmd = (
-        f'jmeter -n -t {test_file} '
-        f'-l results/{test_name}_results.jtl '
-        f'-j results/{test_name}_jmeter.log '
-        f'-e -o results/{test_name}_report '
-        f'-JHOST={host} '
-        f'-JPORT={port} '
-        f'-JPROTOCOL={protocol} '
-        f'-JCONTEXT_PATH={context_path} '
-        f'-JBASE_URL={base_url}'
-    )
-    
-    jmeter_result = subprocess.run(jmeter_cmd, shell=True)
+    # Without a shell, resolve the launcher ourselves (shutil.which honours PATHEXT,
+    # so jmeter.bat is found on Windows); JMeter inherits our stdout/stderr directly
+    jmeter_bin = shutil.which(jmeter_cmd[0])
+    if jmeter_bin:
+        jmeter_returncode = subprocess.run([jmeter_bin] + jmeter_cmd[1:]).returncode
+    else:
+        print_color("[ERROR] jmeter not found on PATH", Colors.RED)
+        jmeter_returncode = 127
     
     print()
-    if jmeter_result.returncode == 0:
+    if jmeter_returncode == 0:
         print_color("[OK] JMeter test completed successfully", Colors.GREEN)
     else:
-        print_color(f"[WARNING] JMeter test completed with errors (Exit Code: {jmeter_result.returncode})", Colors.YELLOW)
+        print_color(f"[WARNING] JMeter test completed with errors (Exit Code: {jmeter_returncode})", Colors.YELLOW)
     print()
     
     # Wait to capture post-test metrics
@@ -637,19 +806,16 @@ def main():
         time.sleep(2)
     
     # Stop Performance Monitoring
-    if args.profile and perf_process:
+    if args.profile and (perf_process or monitor_thread):
         print_color("[4/7] Stopping performance monitoring...", Colors.YELLOW)
         if os.name == 'nt':
             # Windows - terminate typeperf
             subprocess.run(['taskkill', '/F', '/PID', str(perf_process.pid)], 
                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         else:
-            # Linux/Mac - terminate process
-            perf_process.terminate()
-            try:
-                perf_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                perf_process.kill()
+            # Linux/Mac - stop the monitor thread; it flushes the CSV before returning
+            monitor_stop.set()
+            monitor_thread.join(5)
         time.sleep(1)
         print_color("[OK] Performance monitoring stopped", Colors.GREEN)
         print()
@@ -737,47 +903,140 @@ def main():
     print(f"  start results/{test_name}_report/index.html")
     print()
 
-def clean_csv(input_file, output_file):
-    """Clean the CSV file by removing PDH header and renaming columns"""
-    # Try different encodings
-    encodings = ['utf-8', 'utf-16-le', 'utf-16', 'utf-16-be']
-    lines = None
-    
-    for encoding in encodings:
-        try:
-            with open(input_file, 'r', encoding=encoding) as infile:
-                lines = infile.readlines()
-            break
-        except (UnicodeDecodeError, UnicodeError):
-            continue
-    
-    if lines is None:
-        raise Exception("Could not decode CSV file with any supported encoding")
+# Byte order marks checked by clean_csv; UTF-32 must be tried before UTF-16
+CSV_BOMS = (
+    (b'\xff\xfe\x00\x00', 'utf-32-le'),
+    (b'\x00\x00\xfe\xff', 'utf-32-be'),
+    (b'\xff\xfe', 'utf-16-le'),
+    (b'\xfe\xff', 'utf-16-be'),
+    (b'\xef\xbb\xbf', 'utf-8'),
+)
+
+# Clean header written in place of the typeperf PDH header; one column per network interface
+TYPEPERF_HEADER = ('Timestamp,CPU_Total_Percent,Memory_Available_MB,Memory_Used_Percent,'
+                   'Disk_Reads_PerSec,Disk_Writes_PerSec{network_headers},DotNet_CPU_Percent,DotNet_Memory_MB')
+
+def detect_csv_encoding(raw):
+    """Return (encoding, bom_length) for a binary file positioned at its start"""
+    head = raw.read(4)
+    for bom, encoding in CSV_BOMS:
+        if head.startswith(bom):
+            return encoding, len(bom)
+    return 'utf-8', 0
+
+def read_header_bytes(infile, encoding, chunk_size=1 << 20):
+    """Read the raw first line of an encoded file, returning (header_bytes, remaining_bytes_read)"""
+    newline = '\n'.encode(encoding)
+    data = b''
+    while True:
+        chunk = infile.read(chunk_size)
+        data += chunk
+        # Only accept a newline aligned to a UTF-16/32 code unit
+        pos = data.find(newline)
+        while pos != -1 and pos % len(newline):
+            pos = data.find(newline, pos + 1)
+        if pos != -1:
+            end = pos + len(newline)
+            return data[:end], data[end:]
+        if not chunk:
+            return data, b''
+
+def clean_header(header_bytes, encoding):
+    """Return the clean CSV header line for a typeperf PDH header, or the line unchanged"""
+    header_line = header_bytes.decode(encoding)
     
     # Check if this is Windows typeperf format (has PDH header) or Linux format (already clean)
-    header_line = lines[0]
+    if 'PDH-CSV' not in header_line and 'Network Interface' not in header_line:
+        return header_line
     
-    if 'PDH-CSV' in header_line or 'Network Interface' in header_line:
-        # Windows typeperf format - needs cleaning
-        network_count = header_line.count('Network Interface')
+    line_end = header_line[len(header_line.rstrip('\r\n')):] or '\n'
+    # bytes.count is a plain memory search, cheaper than scanning the wide str again
+    network_count = header_bytes.count('Network Interface'.encode(encoding))
+    
+    network_headers = ''.join(',Network%d_Bytes_PerSec' % (i + 1) for i in range(network_count))
+    return TYPEPERF_HEADER.format(network_headers=network_headers) + line_end
+
+def clean_csv(input_file, output_file, chunk_size=1 << 20):
+    """Clean the CSV file by removing PDH header and renaming columns"""
+    with open(input_file, 'rb') as infile, open(output_file, 'wb') as outfile:
+        # typeperf writes UTF-16 with a BOM, Linux monitoring writes plain UTF-8
+        encoding, bom_length = detect_csv_encoding(infile)
+        infile.seek(bom_length)
         
-        # Skip first line (PDH header)
-        data_lines = lines[1:]
+        header_bytes, rest = read_header_bytes(infile, encoding, chunk_size)
+        outfile.write(clean_header(header_bytes, encoding).encode('utf-8'))
         
-        # Create new header with clean names
-        if network_count > 0:
-            network_headers = ','.join([f'Network{i+1}_Bytes_PerSec' for i in range(network_count)])
-            new_header = f'Timestamp,CPU_Total_Percent,Memory_Available_MB,Memory_Used_Percent,Disk_Reads_PerSec,Disk_Writes_PerSec,{network_headers},DotNet_CPU_Percent,DotNet_Memory_MB\n'
-        else:
-            new_header = 'Timestamp,CPU_Total_Percent,Memory_Available_MB,Memory_Used_Percent,Disk_Reads_PerSec,Disk_Writes_PerSec,DotNet_CPU_Percent,DotNet_Memory_MB\n'
+        if encoding == 'utf-8':
+            # Already UTF-8: copy the data rows through as raw bytes
+            outfile.write(rest)
+            shutil.copyfileobj(infile, outfile, chunk_size)
+            return
         
-        with open(output_file, 'w', encoding='utf-8') as outfile:
-            outfile.write(new_header)
-            outfile.writelines(data_lines)
+        # Transcode to UTF-8 in 1 MiB chunks with a single incremental decode pass
+        decoder = codecs.getincrementaldecoder(encoding)()
+        outfile.write(decoder.decode(rest).encode('utf-8'))
+        for chunk in iter(lambda: infile.read(chunk_size), b''):
+            outfile.write(decoder.decode(chunk).encode('utf-8'))
+        outfile.write(decoder.decode(b'', final=True).encode('utf-8'))
+
+# Only columns averaged by generate_summary
+SUMMARY_COLUMNS = ('CPU_Total_Percent', 'Memory_Available_MB', 'Memory_Used_Percent',
+                   'DotNet_CPU_Percent', 'DotNet_Memory_MB')
+
+def summary_means(clean_file):
+    """Average the summary columns in a single streaming pass over the clean CSV"""
+    sums = dict.fromkeys(SUMMARY_COLUMNS, 0.0)
+    counts = dict.fromkeys(SUMMARY_COLUMNS, 0)
+    
+    if PYARROW_AVAILABLE:
+        # Arrow parses CSV blocks in parallel and only converts the selected columns
+        reader = pacsv.open_csv(
+            clean_file,
+            convert_options=pacsv.ConvertOptions(
+                include_columns=list(SUMMARY_COLUMNS),
+                column_types=dict.fromkeys(SUMMARY_COLUMNS, pa.float32()),
+                null_values=['', ' ']
+            )
+        )
+        for batch in reader:
+            for col in SUMMARY_COLUMNS:
+                values = batch.column(col)
+                sums[col] += pc.sum(values).as_py() or 0.0
+                counts[col] += pc.count(values).as_py()
     else:
-        # Linux format - already has clean headers, just copy
-        with open(output_file, 'w', encoding='utf-8') as outfile:
-            outfile.writelines(lines)
+        try:
+            import pandas as pd
+        except ImportError:
+            pd = None
+        
+        if pd is not None:
+            chunks = pd.read_csv(
+                clean_file,
+                usecols=SUMMARY_COLUMNS,
+                dtype=dict.fromkeys(SUMMARY_COLUMNS, 'float32'),
+                engine='c',
+                na_values=[' '],
+                chunksize=65536
+            )
+            for chunk in chunks:
+                chunk_sums = chunk.sum()
+                chunk_counts = chunk.count()
+                for col in SUMMARY_COLUMNS:
+                    sums[col] += float(chunk_sums[col])
+                    counts[col] += int(chunk_counts[col])
+        else:
+            with open(clean_file, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader)
+                indices = [(col, header.index(col)) for col in SUMMARY_COLUMNS]
+                for row in reader:
+                    for col, i in indices:
+                        value = row[i].strip()
+                        if value:
+                            sums[col] += float(value)
+                            counts[col] += 1
+    
+    return {col: sums[col] / counts[col] if counts[col] else float('nan') for col in SUMMARY_COLUMNS}
 
 def generate_summary(clean_file):
     """Generate summary statistics from clean CSV"""
@@ -785,28 +1044,26 @@ def generate_summary(clean_file):
         return
     
     try:
-        import pandas as pd
-        
-        df = pd.read_csv(clean_file)
+        means = summary_means(clean_file)
         
         # Calculate statistics
-        cpu_avg = df['CPU_Total_Percent'].mean()
-        mem_used_avg = df['Memory_Used_Percent'].mean()
-        mem_avail_avg = df['Memory_Available_MB'].mean()
-        dotnet_cpu_avg = df['DotNet_CPU_Percent'].mean()
-        dotnet_mem_avg = df['DotNet_Memory_MB'].mean() / (1024 * 1024)  # Convert to MB
+        cpu_avg = means['CPU_Total_Percent']
+        mem_used_avg = means['Memory_Used_Percent']
+        mem_avail_avg = means['Memory_Available_MB']
+        dotnet_cpu_avg = means['DotNet_CPU_Percent']
+        dotnet_mem_avg = means['DotNet_Memory_MB'] / (1024 * 1024)  # Convert to MB
         
-        print()
-        print_color("System Performance Summary:", Colors.CYAN)
-        print_color("=" * 40, Colors.CYAN)
-        print_color(f"CPU Total Average: {cpu_avg:.2f}%", Colors.YELLOW)
-        print_color(f"Memory Available Average: {mem_avail_avg:.2f} MB", Colors.YELLOW)
-        print_color(f"Memory Used Average: {mem_used_avg:.2f}%", Colors.YELLOW)
-        print_color(f"DotNet CPU Average: {dotnet_cpu_avg:.2f}%", Colors.GREEN)
-        print_color(f"DotNet Memory Average: {dotnet_mem_avg:.2f} MB", Colors.GREEN)
-        print()
-    except ImportError:
-        print_color("[INFO] Install pandas for detailed statistics: pip install pandas", Colors.YELLOW)
+        # Build the whole block first so it goes out in a single write
+        summary = [
+            (Colors.CYAN, "System Performance Summary:"),
+            (Colors.CYAN, "=" * 40),
+            (Colors.YELLOW, f"CPU Total Average: {cpu_avg:.2f}%"),
+            (Colors.YELLOW, f"Memory Available Average: {mem_avail_avg:.2f} MB"),
+            (Colors.YELLOW, f"Memory Used Average: {mem_used_avg:.2f}%"),
+            (Colors.GREEN, f"DotNet CPU Average: {dotnet_cpu_avg:.2f}%"),
+            (Colors.GREEN, f"DotNet Memory Average: {dotnet_mem_avg:.2f} MB")
+        ]
+        print("\n" + "\n".join(color_text(text, color) for color, text in summary) + "\n")
     except Exception as e:
         print_color(f"[WARNING] Could not generate summary: {e}", Colors.YELLOW)
 
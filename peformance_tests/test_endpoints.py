@@ -1,176 +1,208 @@
 """
 Test PetClinic endpoints to verify correct URL patterns
 """
+import re
 import requests
+from requests.adapters import HTTPAdapter
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 BASE_URL = "http://10.134.77.66:8080/petclinic"
 
-def test_endpoint(method, path, data=None, follow_redirects=True, description=""):
-    """Test an endpoint and print results"""
+# Shared session so every test reuses pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.headers['Connection'] = 'keep-alive'
+SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Tests 1-5 and 11 (vets HTML/JSON) have no dependencies and run concurrently
+INDEPENDENT_TESTS = [
+    ("GET", "/", "Home Page"),
+    ("GET", "/owners/find.html", "Find Owners Page"),
+    ("GET", "/owners.html?lastName=Davis", "Search for Davis"),
+    ("GET", "/owners/1.html", "View Owner 1"),
+    ("GET", "/owners/new", "Get New Owner Form"),
+    ("GET", "/vets.html", "Vets Page (HTML)"),
+    ("GET", "/vets.json", "Vets Page (JSON)"),
+]
+
+# One pass over the response finds owner/pet IDs and Add Pet/Add Visit links.
+# The link group is a lookahead so IDs inside those hrefs are still matched.
+RESPONSE_PATTERN = re.compile(
+    r'/owners/(?P<owner>\d+)'
+    r'|/pets/(?P<pet>\d+)'
+    r'|href="(?=(?P<link>[^"]*(?:pets|visits)/new[^"]*)")'
+)
+
+def run_endpoint(method, path, data=None, follow_redirects=True, description=""):
+    """Test an endpoint and return (response, output) so concurrent tests don't interleave"""
     url = BASE_URL + path
-    print(f"\n{'='*80}")
-    print(f"Testing: {description}")
-    print(f"{method} {url}")
+    lines = []
+    log = lines.append
+    log(f"\n{'='*80}")
+    log(f"Testing: {description}")
+    log(f"{method} {url}")
     
     try:
         if method == "GET":
-            response = requests.get(url, allow_redirects=follow_redirects)
+            response = SESSION.get(url, allow_redirects=follow_redirects)
         elif method == "POST":
-            print(f"POST Data: {data}")
-            response = requests.post(url, data=data, allow_redirects=follow_redirects)
+            log(f"POST Data: {data}")
+            response = SESSION.post(url, data=data, allow_redirects=follow_redirects)
         
-        print(f"Status Code: {response.status_code}")
-        print(f"Final URL: {response.url}")
+        log(f"Status Code: {response.status_code}")
+        log(f"Final URL: {response.url}")
         
         # Check for redirects
         if response.history:
-            print(f"Redirect History:")
+            log(f"Redirect History:")
             for i, resp in enumerate(response.history, 1):
-                print(f"  {i}. {resp.status_code} -> {resp.url}")
+                log(f"  {i}. {resp.status_code} -> {resp.url}")
         
         # Look for important patterns in response
         content = response.text
         
-        # Check for owner ID in response
-        if "/owners/" in content:
-            import re
-            owner_links = re.findall(r'/owners/(\d+)', content)
-            if owner_links:
-                print(f"Found owner IDs in response: {set(owner_links)}")
-        
-        # Check for pet links
-        if "/pets/" in content:
-            import re
-            pet_links = re.findall(r'/pets/(\d+)', content)
-            if pet_links:
-                print(f"Found pet IDs in response: {set(pet_links)}")
-        
-        # Check for Add Pet link
-        if "pets/new" in content:
-            import re
-            add_pet_links = re.findall(r'href="([^"]*pets/new[^"]*)"', content)
-            if add_pet_links:
-                print(f"Found 'Add Pet' links: {add_pet_links}")
+        owner_ids, pet_ids, add_pet_links, add_visit_links = set(), set(), [], []
+        # End of the last link of each kind, so overlapping hrefs are skipped as findall would
+        add_pet_end = add_visit_end = 0
+        for match in RESPONSE_PATTERN.finditer(content):
+            kind = match.lastgroup
+            if kind == 'owner':
+                owner_ids.add(match['owner'])
+            elif kind == 'pet':
+                pet_ids.add(match['pet'])
+            else:
+                # One href can hold both, e.g. /owners/1/pets/new?next=/pets/2/visits/new
+                link, start, end = match['link'], match.start(), match.end('link') + 1
+                if 'pets/new' in link and start >= add_pet_end:
+                    add_pet_links.append(link)
+                    add_pet_end = end
+                if 'visits/new' in link and start >= add_visit_end:
+                    add_visit_links.append(link)
+                    add_visit_end = end
         
-        # Check for Add Visit link
-        if "visits/new" in content:
-            import re
-            add_visit_links = re.findall(r'href="([^"]*visits/new[^"]*)"', content)
-            if add_visit_links:
-                print(f"Found 'Add Visit' links: {add_visit_links}")
+        if owner_ids:
+            log(f"Found owner IDs in response: {owner_ids}")
+        if pet_ids:
+            log(f"Found pet IDs in response: {pet_ids}")
+        if add_pet_links:
+            log(f"Found 'Add Pet' links: {add_pet_links}")
+        if add_visit_links:
+            log(f"Found 'Add Visit' links: {add_visit_links}")
         
-        return response
+        return response, '\n'.join(lines)
         
     except Exception as e:
-        print(f"ERROR: {e}")
-        return None
+        log(f"ERROR: {e}")
+        return None, '\n'.join(lines)
+
+def test_endpoint(method, path, data=None, follow_redirects=True, description=""):
+    """Test an endpoint and print results"""
+    response, output = run_endpoint(method, path, data, follow_redirects, description)
+    print(output)
+    return response
 
 def main():
-    print("="*80)
-    print("PetClinic Endpoint Testing")
-    print("="*80)
-    
-    # Test 1: Home page
-    test_endpoint("GET", "/", description="Home Page")
-    
-    # Test 2: Find owners page
-    test_endpoint("GET", "/owners/find.html", description="Find Owners Page")
-    
-    # Test 3: Search for existing owner
-    test_endpoint("GET", "/owners.html?lastName=Davis", description="Search for Davis")
-    
-    # Test 4: View specific owner (use a known ID like 1)
-    test_endpoint("GET", "/owners/1.html", description="View Owner 1")
-    
-    # Test 5: Get add owner form
-    test_endpoint("GET", "/owners/new", description="Get New Owner Form")
-    
-    # Test 6: Create a new owner
-    new_owner_data = {
-        'firstName': 'TestUser',
-        'lastName': 'Python',
-        'address': '123 Test Street',
-        'city': 'Madison',
-        'telephone': '6085559999'
-    }
-    response = test_endpoint("POST", "/owners/new", data=new_owner_data, 
-                           description="Create New Owner")
-    
-    if response and response.status_code in [200, 302]:
-        # Extract owner ID from redirect or response
-        import re
+    try:
+        print("="*80)
+        print("PetClinic Endpoint Testing")
+        print("="*80)
         
-        # Try from URL
-        owner_id = None
-        if response.url and "/owners/" in response.url:
-            match = re.search(r'/owners/(\d+)', response.url)
-            if match:
-                owner_id = match.group(1)
+        # Stage 1: tests that don't depend on each other run concurrently over the
+        # shared session; output is still printed in the original order
+        executor = ThreadPoolExecutor(max_workers=8)
+        futures = [executor.submit(run_endpoint, method, path, description=description)
+                   for method, path, description in INDEPENDENT_TESTS]
+        executor.shutdown(wait=False)
         
-        # Try from response body
-        if not owner_id and response.text:
-            # Look for pets/new link
-            match = re.search(r'/owners/(\d+)/pets/new', response.text)
-            if match:
-                owner_id = match.group(1)
+        for future in futures[:5]:
+            print(future.result()[1])
         
-        if owner_id:
-            print(f"\n{'='*80}")
-            print(f"✓ Successfully created owner with ID: {owner_id}")
-            print(f"{'='*80}")
-            
-            # Test 7: Get add pet form
-            test_endpoint("GET", f"/owners/{owner_id}/pets/new", 
-                        description=f"Get New Pet Form for Owner {owner_id}")
+        # Stage 2: owner -> pet -> visit chain, each step needs the previous ID
+        # Test 6: Create a new owner
+        new_owner_data = {
+            'firstName': 'TestUser',
+            'lastName': 'Python',
+            'address': '123 Test Street',
+            'city': 'Madison',
+            'telephone': '6085559999'
+        }
+        response = test_endpoint("POST", "/owners/new", data=new_owner_data, 
+                               description="Create New Owner")
+        
+        if response and response.status_code in [200, 302]:
+            # Extract owner ID from redirect or response
+            # Try from URL
+            owner_id = None
+            if response.url and "/owners/" in response.url:
+                match = re.search(r'/owners/(\d+)', response.url)
+                if match:
+                    owner_id = match.group(1)
             
-            # Test 8: Create a new pet
-            new_pet_data = {
-                'name': 'TestPet',
-                'birthDate': datetime.now().strftime('%Y/%m/%d'),
-                'type': 'dog'
-            }
-            pet_response = test_endpoint("POST", f"/owners/{owner_id}/pets/new", 
-                                       data=new_pet_data, 
-                                       description=f"Create New Pet for Owner {owner_id}")
+            # Try from response body
+            if not owner_id and response.text:
+                # Look for pets/new link
+                match = re.search(r'/owners/(\d+)/pets/new', response.text)
+                if match:
+                    owner_id = match.group(1)
             
-            if pet_response and pet_response.status_code in [200, 302]:
-                # Extract pet ID
-                import re
-                pet_id = None
+            if owner_id:
+                print(f"\n{'='*80}")
+                print(f"✓ Successfully created owner with ID: {owner_id}")
+                print(f"{'='*80}")
+                
+                # Test 7: Get add pet form
+                test_endpoint("GET", f"/owners/{owner_id}/pets/new", 
+                            description=f"Get New Pet Form for Owner {owner_id}")
                 
-                # Look for pet ID in visits/new link
-                if pet_response.text:
-                    match = re.search(r'/pets/(\d+)/visits/new', pet_response.text)
-                    if match:
-                        pet_id = match.group(1)
+                # Test 8: Create a new pet
+                new_pet_data = {
+                    'name': 'TestPet',
+                    'birthDate': datetime.now().strftime('%Y/%m/%d'),
+                    'type': 'dog'
+                }
+                pet_response = test_endpoint("POST", f"/owners/{owner_id}/pets/new", 
+                                           data=new_pet_data, 
+                                           description=f"Create New Pet for Owner {owner_id}")
                 
-                if pet_id:
-                    print(f"\n{'='*80}")
-                    print(f"✓ Successfully created pet with ID: {pet_id}")
-                    print(f"{'='*80}")
+                if pet_response and pet_response.status_code in [200, 302]:
+                    # Extract pet ID
+                    pet_id = None
                     
-                    # Test 9: Get add visit form
-                    test_endpoint("GET", f"/owners/{owner_id}/pets/{pet_id}/visits/new", 
-                                description=f"Get New Visit Form for Pet {pet_id}")
+                    # Look for pet ID in visits/new link
+                    if pet_response.text:
+                        match = re.search(r'/pets/(\d+)/visits/new', pet_response.text)
+                        if match:
+                            pet_id = match.group(1)
                     
-                    # Test 10: Create a visit
-                    new_visit_data = {
-                        'date': datetime.now().strftime('%Y/%m/%d'),
-                        'description': 'Test visit from Python script'
-                    }
-                    test_endpoint("POST", f"/owners/{owner_id}/pets/{pet_id}/visits/new", 
-                                data=new_visit_data, 
-                                description=f"Create New Visit for Pet {pet_id}")
-    
-    # Test 11: Vets page
-    test_endpoint("GET", "/vets.html", description="Vets Page (HTML)")
-    test_endpoint("GET", "/vets.json", description="Vets Page (JSON)")
-    
-    print(f"\n{'='*80}")
-    print("Testing Complete")
-    print(f"{'='*80}")
+                    if pet_id:
+                        print(f"\n{'='*80}")
+                        print(f"✓ Successfully created pet with ID: {pet_id}")
+                        print(f"{'='*80}")
+                        
+                        # Test 9: Get add visit form
+                        test_endpoint("GET", f"/owners/{owner_id}/pets/{pet_id}/visits/new", 
+                                    description=f"Get New Visit Form for Pet {pet_id}")
+                        
+                        # Test 10: Create a visit
+                        new_visit_data = {
+                            'date': datetime.now().strftime('%Y/%m/%d'),
+                            'description': 'Test visit from Python script'
+                        }
+                        test_endpoint("POST", f"/owners/{owner_id}/pets/{pet_id}/visits/new", 
+                                    data=new_visit_data, 
+                                    description=f"Create New Visit for Pet {pet_id}")
+        
+        # Vets pages ran in stage 1
+        for future in futures[5:]:
+            print(future.result()[1])
+        
+        print(f"\n{'='*80}")
+        print("Testing Complete")
+        print(f"{'='*80}")
+    finally:
+        SESSION.close()
 
 if __name__ == "__main__":
     main()
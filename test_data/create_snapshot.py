@@ -1,21 +1,75 @@
 """
 Create snapshot of PetClinic PostgreSQL database
-Saves all data to a JSON file for backup and restoration
+Saves all data to a JSON file (or per-table Parquet / binary COPY files) for backup and restoration
 """
 import psycopg2
+from psycopg2.extras import RealDictCursor
 import json
 import argparse
+from functools import lru_cache
 from datetime import datetime, date
 from pathlib import Path
 
+try:
+    # psycopg 3 can request binary results, skipping psycopg2's per-cell text parsing
+    import psycopg
+    from psycopg.rows import dict_row
+    PSYCOPG3_AVAILABLE = True
+except ImportError:
+    PSYCOPG3_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+    
+    # Arrow types for the PostgreSQL type OIDs used by the PetClinic schema;
+    # anything else is stored as text
+    PG_ARROW_TYPES = {
+        16: pa.bool_(),
+        20: pa.int64(),
+        21: pa.int16(),
+        23: pa.int32(),
+        700: pa.float32(),
+        701: pa.float64(),
+        25: pa.string(),
+        1043: pa.string(),
+        1082: pa.date32(),
+        1114: pa.timestamp('us'),
+        1184: pa.timestamp('us', tz='UTC'),
+    }
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+@lru_cache(maxsize=8)
+def _read_config(resolved_path):
+    """Parse a config file once per process"""
+    with open(resolved_path, 'r') as f:
+        return json.load(f)
+
 def load_config(config_path="../db_config.json", env_name="target"):
     """Load database configuration from JSON file"""
-    with open(config_path, 'r') as f:
-        config = json.load(f)
-    return config['environments'][env_name]
+    # Resolve the path so relative and absolute spellings share one cache entry
+    config = _read_config(str(Path(config_path).resolve()))
+    # Hand out a copy so callers can't modify the cached config
+    return dict(config['environments'][env_name])
 
 def get_connection(env_config):
     """Create PostgreSQL connection from environment config"""
+    if PSYCOPG3_AVAILABLE:
+        return psycopg.connect(
+            host=env_config['host'],
+            port=env_config['port'],
+            dbname=env_config['database'],
+            user=env_config['username'],
+            password=env_config['password']
+        )
     return psycopg2.connect(
         host=env_config['host'],
         port=env_config['port'],
@@ -30,9 +84,99 @@ def json_serial(obj):
         return obj.isoformat()
     raise TypeError(f"Type {type(obj)} not serializable")
 
-def create_snapshot(env_name="target", config_path="../../db_config.json", output_file=None):
+def dump_json(obj):
+    """Serialize an object to compact UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        # orjson emits UTF-8 bytes directly and handles dates natively
+        return orjson.dumps(obj, default=json_serial)
+    return json.dumps(obj, ensure_ascii=False, default=json_serial).encode('utf-8')
+
+def open_data_cursor(conn, table_name):
+    """Open a server-side cursor returning dict rows, in binary format on psycopg 3"""
+    if PSYCOPG3_AVAILABLE:
+        return conn.cursor(name=f'snap_{table_name}', row_factory=dict_row, binary=True)
+    return conn.cursor(name=f'snap_{table_name}', cursor_factory=RealDictCursor)
+
+def write_json_table(conn, table_name, f, batch_size=10000):
+    """Stream a table into an open JSON snapshot as one row per line, returning its columns and row count"""
+    row_count = 0
+    
+    with open_data_cursor(conn, table_name) as data_cursor:
+        data_cursor.execute(f'SELECT * FROM petclinic."{table_name}"')
+        rows = data_cursor.fetchmany(batch_size)
+        
+        # Named cursors only expose description after the first fetch
+        columns = [col.name for col in data_cursor.description]
+        f.write(dump_json(table_name) + b': {"columns": ' + dump_json(columns) + b', "data": [')
+        
+        while rows:
+            f.write(b',\n      ' if row_count else b'\n      ')
+            f.write(b',\n      '.join(map(dump_json, rows)))
+            row_count += len(rows)
+            rows = data_cursor.fetchmany(batch_size)
+    
+    f.write(b'\n    ], "row_count": %d}' % row_count)
+    return columns, row_count
+
+def write_copy_table(cursor, table_name, path):
+    """Dump a table with binary COPY straight to a file, returning its columns and row count"""
+    # COPY has no result description, so read the column names from an empty SELECT
+    cursor.execute(f'SELECT * FROM petclinic."{table_name}" LIMIT 0')
+    columns = [col.name for col in cursor.description]
+    columns_str = ', '.join([f'"{col}"' for col in columns])
+    
+    copy_sql = f'COPY petclinic."{table_name}" ({columns_str}) TO STDOUT WITH (FORMAT BINARY)'
+    with open(path, 'wb') as f:
+        if PSYCOPG3_AVAILABLE:
+            with cursor.copy(copy_sql) as copy:
+                for data in copy:
+                    f.write(data)
+        else:
+            cursor.copy_expert(copy_sql, f)
+    return columns, cursor.rowcount
+
+def write_parquet_table(conn, table_name, path, batch_size=10000):
+    """Stream a table into a zstd-compressed Parquet file, returning its columns and row count"""
+    writer = None
+    row_count = 0
+    
+    with open_data_cursor(conn, table_name) as data_cursor:
+        data_cursor.execute(f'SELECT * FROM petclinic."{table_name}"')
+        try:
+            while True:
+                rows = data_cursor.fetchmany(batch_size)
+                
+                if writer is None:
+                    # Named cursors only expose description after the first fetch
+                    columns = [col.name for col in data_cursor.description]
+                    text_columns = [col.name for col in data_cursor.description
+                                    if col.type_code not in PG_ARROW_TYPES]
+                    schema = pa.schema([(col.name, PG_ARROW_TYPES.get(col.type_code, pa.string()))
+                                        for col in data_cursor.description])
+                    writer = pq.ParquetWriter(path, schema, compression='zstd')
+                
+                if not rows:
+                    break
+                
+                for row in rows:
+                    for col_name in text_columns:
+                        if row[col_name] is not None:
+                            row[col_name] = str(row[col_name])
+                
+                writer.write_batch(pa.RecordBatch.from_pylist(rows, schema=schema))
+                row_count += len(rows)
+        finally:
+            if writer is not None:
+                writer.close()
+    
+    return columns, row_count
+
+def create_snapshot(env_name="target", config_path="../../db_config.json", output_file=None, output_format="json"):
     """Create a complete snapshot of the database"""
     try:
+        if output_format == 'parquet' and not PYARROW_AVAILABLE:
+            raise Exception("pyarrow is required for Parquet snapshots: pip install pyarrow")
+        
         # Load configuration
         env_config = load_config(config_path, env_name)
         
@@ -42,80 +186,102 @@ def create_snapshot(env_name="target", config_path="../../db_config.json", outpu
         print(f"Environment: {env_name}")
         print(f"Database: {env_config['database']}")
         print(f"Host: {env_config['host']}")
+        print(f"Format: {output_format}")
         print(f"{'='*70}\n")
         
+        # Generate output name if not provided; Parquet and COPY snapshots are a directory of table files
+        if output_file is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_file = f"../petclinic_snapshot_{env_name}_{timestamp}"
+            if output_format == 'json':
+                output_file += '.json'
+        
+        if output_format != 'json':
+            Path(output_file).mkdir(parents=True, exist_ok=True)
+        
         conn = get_connection(env_config)
         cursor = conn.cursor()
         
-        snapshot = {
-            'metadata': {
-                'snapshot_date': datetime.now().isoformat(),
-                'database': env_config['database'],
-                'host': env_config['host'],
-                'environment': env_name
-            },
-            'tables': {}
+        # Only the metadata and per-table summaries are kept in memory; rows go straight to disk
+        metadata = {
+            'snapshot_date': datetime.now().isoformat(),
+            'database': env_config['database'],
+            'host': env_config['host'],
+            'environment': env_name,
+            'format': output_format
         }
+        tables = {}
+        total_rows = 0
         
         # Define table order for restoration (respecting foreign keys)
         table_order = ['types', 'specialties', 'owners', 'vets', 'vet_specialties', 'pets', 'visits']
         
-        for table_name in table_order:
-            print(f"Snapshotting table: {table_name}...")
+        json_file = open(output_file, 'wb') if output_format == 'json' else None
+        try:
+            if json_file:
+                json_file.write(b'{\n  "metadata": ' + dump_json(metadata) + b',\n  "tables": {')
             
-            # Get column names
-            cursor.execute("""
-                SELECT column_name
-                FROM information_schema.columns
-                WHERE table_schema = 'petclinic' AND table_name = %s
-                ORDER BY ordinal_position
-            """, (table_name,))
+            for table_name in table_order:
+                print(f"Snapshotting table: {table_name}...")
+                
+                if output_format == 'parquet':
+                    table_file = f"{table_name}.parquet"
+                    columns, row_count = write_parquet_table(conn, table_name, Path(output_file) / table_file)
+                    tables[table_name] = {
+                        'columns': columns,
+                        'row_count': row_count,
+                        'file': table_file
+                    }
+                elif output_format == 'copy':
+                    # Binary COPY skips building Python row objects entirely
+                    table_file = f"{table_name}.pgbin"
+                    columns, row_count = write_copy_table(cursor, table_name, Path(output_file) / table_file)
+                    tables[table_name] = {
+                        'columns': columns,
+                        'row_count': row_count,
+                        'file': table_file
+                    }
+                else:
+                    json_file.write(b',\n    ' if tables else b'\n    ')
+                    columns, row_count = write_json_table(conn, table_name, json_file)
+                    tables[table_name] = {
+                        'columns': columns,
+                        'row_count': row_count
+                    }
+                
+                total_rows += row_count
+                print(f"  ✓ Captured {row_count} rows from {table_name}")
             
-            columns = [row[0] for row in cursor.fetchall()]
-            
-            # Get all data
-            cursor.execute(f'SELECT * FROM petclinic."{table_name}"')
-            rows = cursor.fetchall()
-            
-            # Convert rows to list of dictionaries
-            table_data = []
-            for row in rows:
-                row_dict = {}
-                for i, col_name in enumerate(columns):
-                    value = row[i]
-                    # Convert to JSON-serializable format
-                    if isinstance(value, (datetime, date)):
-                        row_dict[col_name] = value.isoformat()
-                    else:
-                        row_dict[col_name] = value
-                table_data.append(row_dict)
-            
-            snapshot['tables'][table_name] = {
-                'columns': columns,
-                'row_count': len(table_data),
-                'data': table_data
-            }
-            
-            print(f"  ✓ Captured {len(table_data)} rows from {table_name}")
+            if json_file:
+                json_file.write(b'\n  }\n}\n')
+        except Exception:
+            # Don't leave a truncated snapshot behind for --reset-data to pick up
+            if json_file:
+                json_file.close()
+                Path(output_file).unlink(missing_ok=True)
+            raise
+        finally:
+            if json_file:
+                json_file.close()
         
         conn.close()
         
-        # Generate output filename if not provided
-        if output_file is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"../petclinic_snapshot_{env_name}_{timestamp}.json"
-        
-        # Save to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(snapshot, f, indent=2, ensure_ascii=False, default=json_serial)
+        if output_format != 'json':
+            # Small JSON manifest keeps the metadata and restore order next to the table files
+            with open(Path(output_file) / 'manifest.json', 'w', encoding='utf-8') as f:
+                json.dump({'metadata': metadata, 'tables': tables}, f, indent=2, ensure_ascii=False)
         
         print(f"\n{'='*70}")
         print(f"Snapshot saved successfully!")
         print(f"{'='*70}")
         print(f"File: {output_file}")
-        print(f"Size: {Path(output_file).stat().st_size:,} bytes")
-        print(f"Total tables: {len(snapshot['tables'])}")
-        print(f"Total rows: {sum(t['row_count'] for t in snapshot['tables'].values())}")
+        if output_format != 'json':
+            size = sum(p.stat().st_size for p in Path(output_file).iterdir())
+        else:
+            size = Path(output_file).stat().st_size
+        print(f"Size: {size:,} bytes")
+        print(f"Total tables: {len(tables)}")
+        print(f"Total rows: {total_rows}")
         print(f"{'='*70}\n")
         
         return output_file
@@ -134,7 +300,10 @@ if __name__ == "__main__":
     parser.add_argument('--config', type=str, default='../db_config.json',
                         help='Path to config file (default: ../db_config.json)')
     parser.add_argument('--output', type=str, default=None,
-                        help='Output file name (default: auto-generated with timestamp)')
+                        help='Output file name, or directory for parquet/copy (default: auto-generated with timestamp)')
+    parser.add_argument('--format', type=str, default='json',
+                        choices=['json', 'parquet', 'copy'],
+                        help='Snapshot format: single JSON file, or one Parquet / binary COPY file per table plus a manifest (default: json)')
     
     args = parser.parse_args()
-    create_snapshot(args.env, args.config, args.output)
+    create_snapshot(args.env, args.config, args.output, args.format)
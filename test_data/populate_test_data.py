@@ -3,7 +3,7 @@ PetClinic Database Test Data Populator
 
 This script:
 1. Clears all existing records from the database
-2. Loads baseline data from snapshot JSON file
+2. Loads baseline data from snapshot JSON file (or binary COPY / Parquet snapshot directory)
 3. Creates additional test records (N specified via command line)
 """
 
@@ -13,9 +13,17 @@ from datetime import datetime, timedelta, date
 import logging
 import random
 import argparse
+import io
 import json
 from pathlib import Path
 
+try:
+    import pyarrow.parquet as pq
+    from pyarrow import csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -141,14 +149,16 @@ class PetClinicDataPopulator:
             conn.close()
     
     def load_snapshot_data(self):
-        """Load data from snapshot JSON file"""
+        """Load data from snapshot JSON file or binary COPY / Parquet snapshot directory"""
         logger.info("\n" + "="*70)
         logger.info("LOADING BASELINE DATA FROM SNAPSHOT")
         logger.info("="*70)
         
-        # Load snapshot file
+        # Load snapshot file; binary COPY and Parquet snapshots are a directory with a manifest
+        snapshot_dir = Path(self.snapshot_file) if Path(self.snapshot_file).is_dir() else None
         try:
-            with open(self.snapshot_file, 'r', encoding='utf-8') as f:
+            manifest_file = snapshot_dir / 'manifest.json' if snapshot_dir else self.snapshot_file
+            with open(manifest_file, 'r', encoding='utf-8') as f:
                 snapshot = json.load(f)
             logger.info(f"Loaded snapshot from: {self.snapshot_file}")
             logger.info(f"Snapshot date: {snapshot['metadata']['snapshot_date']}")
@@ -159,6 +169,14 @@ class PetClinicDataPopulator:
             logger.error(f"Invalid JSON in snapshot file: {e}")
             sys.exit(1)
         
+        snapshot_format = snapshot['metadata'].get('format') if snapshot_dir else 'json'
+        if snapshot_format not in ('json', 'copy', 'parquet'):
+            logger.error(f"Unsupported snapshot format: {snapshot_format} (expected json, copy or parquet)")
+            sys.exit(1)
+        if snapshot_format == 'parquet' and not PYARROW_AVAILABLE:
+            logger.error("pyarrow is required to load Parquet snapshots: pip install pyarrow")
+            sys.exit(1)
+        
         conn = self.get_connection()
         cursor = conn.cursor()
         
@@ -172,9 +190,10 @@ class PetClinicDataPopulator:
                     continue
                 
                 table_data = snapshot['tables'][table_name]
-                rows = table_data['data']
+                rows = None if snapshot_dir else table_data['data']
+                row_count = table_data['row_count'] if snapshot_dir else len(rows)
                 
-                if not rows:
+                if not row_count:
                     logger.info(f"  • Skipped {table_name} (no data in snapshot)")
                     continue
                 
@@ -182,6 +201,28 @@ class PetClinicDataPopulator:
                 placeholders = ', '.join(['%s'] * len(columns))
                 columns_str = ', '.join([f'"{col}"' for col in columns])
                 
+                if snapshot_format == 'copy':
+                    with open(snapshot_dir / table_data['file'], 'rb') as f:
+                        cursor.copy_expert(
+                            f'COPY petclinic."{table_name}" ({columns_str}) FROM STDIN WITH (FORMAT BINARY)', f)
+                    conn.commit()
+                    logger.info(f"  ✓ Loaded {row_count:>5} rows into {table_name}")
+                    continue
+                
+                if snapshot_format == 'parquet':
+                    # Stream record batches through COPY as CSV; strings are always quoted,
+                    # so only nulls come out as unquoted empty fields
+                    parquet_file = pq.ParquetFile(snapshot_dir / table_data['file'])
+                    for batch in parquet_file.iter_batches(batch_size=10000, columns=columns):
+                        buffer = io.BytesIO()
+                        pacsv.write_csv(batch, buffer, pacsv.WriteOptions(include_header=False))
+                        buffer.seek(0)
+                        cursor.copy_expert(
+                            f'COPY petclinic."{table_name}" ({columns_str}) FROM STDIN WITH (FORMAT CSV)', buffer)
+                    conn.commit()
+                    logger.info(f"  ✓ Loaded {row_count:>5} rows into {table_name}")
+                    continue
+                
                 insert_query = f'INSERT INTO petclinic."{table_name}" ({columns_str}) VALUES ({placeholders})'
                 
                 for row in rows:
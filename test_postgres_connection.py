@@ -22,14 +22,16 @@ def test_postgres_connection():
         'password': 'petclinic'
     }
     
-    print("=" * 60)
-    print("Testing PostgreSQL Connection")
-    print("=" * 60)
-    print(f"Host: {connection_params['host']}")
-    print(f"Port: {connection_params['port']}")
-    print(f"Database: {connection_params['database']}")
-    print(f"User: {connection_params['user']}")
-    print("-" * 60)
+    print("\n".join([
+        "=" * 60,
+        "Testing PostgreSQL Connection",
+        "=" * 60,
+        f"Host: {connection_params['host']}",
+        f"Port: {connection_params['port']}",
+        f"Database: {connection_params['database']}",
+        f"User: {connection_params['user']}",
+        "-" * 60
+    ]))
     
     connection = None
     try:
@@ -42,8 +44,7 @@ def test_postgres_connection():
         cursor = connection.cursor()
         cursor.execute("SELECT version();")
         db_version = cursor.fetchone()
-        print(f"\nPostgreSQL Version:")
-        print(f"  {db_version[0]}")
+        report = ["\nPostgreSQL Version:", f"  {db_version[0]}"]
         
         # Get list of tables
         cursor.execute("""
@@ -54,12 +55,11 @@ def test_postgres_connection():
         """)
         tables = cursor.fetchall()
         
-        print(f"\nTables in database '{connection_params['database']}':")
+        report.append(f"\nTables in database '{connection_params['database']}':")
         if tables:
-            for table in tables:
-                print(f"  - {table[0]}")
+            report.extend(f"  - {table[0]}" for table in tables)
         else:
-            print("  No tables found in public schema")
+            report.append("  No tables found in public schema")
         
         # Get table count
         cursor.execute("""
@@ -68,39 +68,34 @@ def test_postgres_connection():
             WHERE table_schema = 'public';
         """)
         table_count = cursor.fetchone()[0]
-        print(f"\nTotal tables: {table_count}")
+        report.append(f"\nTotal tables: {table_count}")
         
         cursor.close()
-        print("\n" + "=" * 60)
-        print("Database is REACHABLE and accessible!")
-        print("=" * 60)
+        report += ["\n" + "=" * 60, "Database is REACHABLE and accessible!", "=" * 60]
+        print("\n".join(report))
         return True
         
     except OperationalError as e:
-        print(f"\n✗ Connection failed!")
-        print(f"\nError details:")
-        print(f"  Type: OperationalError")
-        print(f"  Message: {str(e)}")
-        print("\nPossible reasons:")
-        print("  1. Database server is not running")
-        print("  2. Firewall blocking connection")
-        print("  3. Incorrect host IP or port")
-        print("  4. Network connectivity issues")
-        print("  5. Database instance not accessible from this location")
+        print("\n".join([
+            "\n✗ Connection failed!",
+            "\nError details:",
+            "  Type: OperationalError",
+            f"  Message: {str(e)}",
+            "\nPossible reasons:",
+            "  1. Database server is not running",
+            "  2. Firewall blocking connection",
+            "  3. Incorrect host IP or port",
+            "  4. Network connectivity issues",
+            "  5. Database instance not accessible from this location"
+        ]))
         return False
         
     except Error as e:
-        print(f"\n✗ Database error!")
-        print(f"\nError details:")
-        print(f"  Type: {type(e).__name__}")
-        print(f"  Message: {str(e)}")
+        print(f"\n✗ Database error!\n\nError details:\n  Type: {type(e).__name__}\n  Message: {str(e)}")
         return False
         
     except Exception as e:
-        print(f"\n✗ Unexpected error!")
-        print(f"\nError details:")
-        print(f"  Type: {type(e).__name__}")
-        print(f"  Message: {str(e)}")
+        print(f"\n✗ Unexpected error!\n\nError details:\n  Type: {type(e).__name__}\n  Message: {str(e)}")
         return False
         
     finally: